@@ -8,7 +8,10 @@ import importlib.metadata
 # Local imports
 from .plot import get_title_from_configuration, plot_3D, plot_heatmap
 from .postprocess import aggregate_output_data
-from .study_da import GenerateScan, SubmitScan, create, create_single_job, submit
+from .study_da import GenerateScan, create, create_single_job, submit
+
+# SubmitScan is imported lazily, only when accessed (not required to create a study)
+from .study_da import __getattr__  # noqa: F401
 
 # ==================================================================================================
 # --- Package version
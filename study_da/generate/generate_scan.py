@@ -13,21 +13,23 @@ configuration file. If the user wants to write an unsafe expression, it's their
 
 # Import standard library modules
 import copy
-import inspect
+import io
 import itertools
+import json
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 # Import third-party modules
 import numpy as np
 import ruamel.yaml as yaml
 from black import FileMode, format_str
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 # Import user-defined modules
-from study_da.utils import clean_dic, load_dic_from_path, nested_set
+from study_da.utils import clean_dic, load_dic_from_path
 
 from .parameter_space import (
     convert_for_subvariables,
@@ -36,6 +38,16 @@ from .parameter_space import (
     logspace,
 )
 
+# ==================================================================================================
+# --- Constants
+# ==================================================================================================
+
+# Paths to the study-da template scripts and configurations (fixed once the module is imported)
+PATH_TEMPLATE_SCRIPTS = f"{os.path.dirname(os.path.abspath(__file__))}/../assets/template_scripts/"
+PATH_TEMPLATE_CONFIGURATIONS = (
+    f"{os.path.dirname(os.path.abspath(__file__))}/../assets/configurations/"
+)
+
 
 # ==================================================================================================
 # --- Class definition
@@ -49,12 +61,20 @@ class GenerateScan:
         config (dict): The configuration dictionary.
         ryaml (yaml.YAML): The YAML parser.
         dic_common_parameters (dict): Dictionary of common parameters across generations.
+        dic_rendered_studies (dict): Cache of the rendered study files for the current generation.
+        dic_environments (dict): Cache of the Jinja environments, per template directory, shared
+            across all instances.
+        emit_yaml_tree (bool): Whether the tree is written as YAML (default) or as JSON.
+        path_tree (str): The path to the tree file.
 
     Methods:
         __init__(): Initializes the generation scan with a configuration file or dictionary.
+        get_template(): Loads and compiles the template of a generation.
         render(): Renders the study file using a template.
         write(): Writes the study file to disk.
+        get_dependencies(): Gets the main configuration and dependencies of a generation.
         generate_render_write(): Generates, renders, and writes the study file.
+        get_str_parameters(): Gets the string representation of the mutated parameters.
         get_dic_parametric_scans(): Retrieves dictionaries of parametric scan values.
         parse_parameter_space(): Parses the parameter space for a given parameter.
         browse_and_collect_parameter_space(): Browses and collects the parameter space for a given
@@ -62,13 +82,18 @@ class GenerateScan:
         postprocess_parameter_lists(): Postprocesses the parameter lists.
         create_scans(): Creates study files for parametric scans.
         complete_tree(): Completes the tree structure of the study dictionary.
-        write_tree(): Writes the study tree structure to a YAML file.
+        write_tree(): Writes the study tree structure to a YAML (or JSON) file.
         create_study_for_current_gen(): Creates study files for the current generation.
         create_study(): Creates study files for the entire study.
         eval_conditions(): Evaluates the conditions to filter out some parameter values.
         filter_for_concomitant_parameters(): Filters the conditions for concomitant parameters.
     """
 
+    # Jinja environments (and their template loaders and compiled templates), per template
+    # directory. Shared across all instances, such that creating many studies in the same process
+    # (e.g. with create_single_job) doesn't load the same templates again
+    dic_environments: dict[str, Environment] = {}
+
     def __init__(
         self, path_config: Optional[str] = None, dic_scan: Optional[dict[str, Any]] = None
     ):  # sourcery skip: remove-redundant-if
@@ -92,7 +117,7 @@ class GenerateScan:
         elif dic_scan is not None and path_config is not None:
             raise ValueError("Only one of the configuration file or dictionary must be provided.")
         elif path_config is not None:
-            self.config, self.ryaml = load_dic_from_path(path_config)
+            self.config, self.ryaml = load_dic_from_path(path_config, use_cache=True, typ="safe")
         elif dic_scan is not None:
             self.config = dic_scan
             self.ryaml = yaml.YAML()
@@ -102,8 +127,41 @@ class GenerateScan:
         # Parameters common across all generations (e.g. for parallelization)
         self.dic_common_parameters: dict[str, Any] = {}
 
-        # Path to the tree file
-        self.path_tree = self.config["name"] + "/" + "tree.yaml"
+        # Rendered (and formatted) study files, to avoid rendering again identical files (e.g. the
+        # same scan point of a given generation across several branches of the tree)
+        self.dic_rendered_studies: dict[tuple[str, str], str] = {}
+
+        # Path to the tree file (JSON if the YAML tree is disabled in the scan configuration)
+        self.emit_yaml_tree: bool = self.config.get("emit_yaml_tree", True)
+        self.path_tree = (
+            self.config["name"] + "/" + ("tree.yaml" if self.emit_yaml_tree else "tree.json")
+        )
+
+    def get_template(self, template_path: str) -> Template:
+        """
+        Loads and compiles the template of a generation. Since the template is the same for all
+        the jobs of a given generation, it should be loaded only once and reused for rendering.
+        The compiled bytecode is also cached on disk (in the user temporary directory), such that
+        subsequent runs don't need to parse the template again. The environment (and therefore the
+        template loader) is built only once per template directory, and shared across instances.
+
+        Args:
+            template_path (str): The path to the template file.
+
+        Returns:
+            Template: The compiled template.
+        """
+        # Absolute path, such that templates from different working directories are not mixed up
+        directory_path = os.path.abspath(os.path.dirname(template_path))
+        template_name = os.path.basename(template_path)
+        if directory_path not in self.dic_environments:
+            self.dic_environments[directory_path] = Environment(
+                loader=FileSystemLoader(directory_path),
+                variable_start_string="{}  ###---",
+                variable_end_string="---###",
+                bytecode_cache=FileSystemBytecodeCache(),
+            )
+        return self.dic_environments[directory_path].get_template(template_name)
 
     def render(
         self,
@@ -112,6 +170,7 @@ class GenerateScan:
         path_main_configuration: str,
         study_path: Optional[str] = None,
         str_dependencies: Optional[dict[str, str]] = None,
+        template: Optional[Template] = None,
     ) -> str:
         """
         Renders the study file using a template.
@@ -122,6 +181,8 @@ class GenerateScan:
             path_main_configuration (str): The path to the main configuration file.
             study_path (str, optional): The path to the root of the study. Defaults to None.
             dependencies (dict[str, str], optional): The dictionary of dependencies. Defaults to {}.
+            template (Template, optional): The already compiled template. If None, the template is
+                loaded from template_path. Defaults to None.
 
         Returns:
             str: The rendered study file.
@@ -134,14 +195,8 @@ class GenerateScan:
             study_path = ""
 
         # Generate generations from template
-        directory_path = os.path.dirname(template_path)
-        template_name = os.path.basename(template_path)
-        environment = Environment(
-            loader=FileSystemLoader(directory_path),
-            variable_start_string="{}  ###---",
-            variable_end_string="---###",
-        )
-        template = environment.get_template(template_name)
+        if template is None:
+            template = self.get_template(template_path)
 
         # Better not to render the dependencies path this way, as it becomes too cumbersome to
         # handle the paths when using clusters
@@ -173,47 +228,22 @@ class GenerateScan:
         if folder != "":
             os.makedirs(folder, exist_ok=True)
 
-        with open(file_path, mode="w", encoding="utf-8") as file:
-            file.write(study_str)
+        # The whole file is encoded at once and written in binary mode, such that it goes to disk
+        # in a single write call, without going through the text layer
+        with open(file_path, mode="wb") as file:
+            file.write(study_str.encode("utf-8"))
 
-    def generate_render_write(
-        self,
-        gen_name: str,
-        job_directory_path: str,
-        template_path: str,
-        depth_gen: int,
-        dic_mutated_parameters: dict[str, Any] = {},
-    ) -> list[str]:  # sourcery skip: default-mutable-arg
+    def get_dependencies(self, depth_gen: int) -> tuple[str, str]:
         """
-        Generates, renders, and writes the study file.
+        Gets the path to the main configuration and the string of dependencies for a given
+        generation. They are the same for all the jobs of the generation.
 
         Args:
-            gen_name (str): The name of the generation.
-            study_path (str): The path to the job folder.
-            template_path (str): The path to the template folder.
             depth_gen (int): The depth of the generation in the tree.
-            dic_mutated_parameters (dict[str, Any], optional): The dictionary of mutated parameters.
-                Defaults to {}.
 
         Returns:
-            tuple[str, list[str]]: The study file string and the list of study paths.
+            tuple[str, str]: The path to the main configuration and the string of dependencies.
         """
-
-        directory_path_gen = f"{job_directory_path}"
-        if not directory_path_gen.endswith("/"):
-            directory_path_gen += "/"
-        file_path_gen = f"{directory_path_gen}{gen_name}.py"
-        logging.info(f'Now rendering generation "{file_path_gen}"')
-
-        # Generate the string of parameters
-        str_parameters = "{"
-        for key, value in dic_mutated_parameters.items():
-            if isinstance(value, str):
-                str_parameters += f"'{key}' : '{value}', "
-            else:
-                str_parameters += f"'{key}' : {value}, "
-        str_parameters += "}"
-
         # Adapt the dict of dependencies to the current generation
         dic_dependencies = self.config["dependencies"] if "dependencies" in self.config else {}
 
@@ -240,22 +270,74 @@ class GenerateScan:
         path_main_configuration = "../" + dic_dependencies.pop("main_configuration").split("/")[-1]
 
         # Create the str for the dependencies
-        str_dependencies = "{"
-        for key, value in dic_dependencies.items():
-            str_dependencies += f"'{key}' : '{value}', "
-        str_dependencies += "}"
+        str_dependencies = (
+            "{"
+            + "".join([f"'{key}' : '{value}', " for key, value in dic_dependencies.items()])
+            + "}"
+        )
+
+        return path_main_configuration, str_dependencies
+
+    def generate_render_write(
+        self,
+        gen_name: str,
+        job_directory_path: str,
+        template_path: str,
+        str_parameters: str,
+        path_main_configuration: str,
+        str_dependencies: str,
+        template: Optional[Template] = None,
+    ) -> str:
+        """
+        Generates, renders, and writes the study file. Only local state is used, such that it can
+        be called from several threads.
+
+        Args:
+            gen_name (str): The name of the generation.
+            job_directory_path (str): The path to the job folder.
+            template_path (str): The path to the template folder.
+            str_parameters (str): The string representation of the mutated parameters.
+            path_main_configuration (str): The path to the main configuration file.
+            str_dependencies (str): The string representation of the dependencies.
+            template (Template, optional): The already compiled template, to avoid reloading it
+                for every job. Defaults to None.
+
+        Returns:
+            str: The rendered (and formatted) study file.
+        """
+        file_path_gen = os.path.join(job_directory_path, f"{gen_name}.py")
+        logging.info(f'Now rendering generation "{file_path_gen}"')
 
-        # Render and write the study file
         study_str = self.render(
             str_parameters,
             template_path=template_path,
             path_main_configuration=path_main_configuration,
             study_path=os.path.abspath(self.config["name"]),
             str_dependencies=str_dependencies,
+            template=template,
         )
+        study_str = format_str(study_str, mode=FileMode())
+
+        # Write the study file (already formatted)
+        self.write(study_str, file_path_gen, format_with_black=False)
+        return study_str
 
-        self.write(study_str, file_path_gen)
-        return [directory_path_gen]
+    @staticmethod
+    def get_str_parameters(dic_mutated_parameters: dict[str, Any]) -> str:
+        """
+        Gets the string representation of the mutated parameters, as declared in the study file.
+
+        Args:
+            dic_mutated_parameters (dict[str, Any]): The dictionary of mutated parameters.
+
+        Returns:
+            str: The string representation of the mutated parameters.
+        """
+        l_str_parameters = [
+            f"'{key}' : '{value}', " if isinstance(value, str) else f"'{key}' : {value}, "
+            for key, value in dic_mutated_parameters.items()
+        ]
+        return "{" + "".join(l_str_parameters) + "}"
 
     def get_dic_parametric_scans(
         self, generation: str
@@ -275,19 +357,17 @@ class GenerateScan:
         if generation == "base":
             raise ValueError("Generation 'base' should not have scans.")
 
+        dic_generation = self.config["structure"][generation]
+
         # Remember common parameters as they might be used across generations
-        if "common_parameters" in self.config["structure"][generation]:
-            self.dic_common_parameters[generation] = {}
-            for parameter in self.config["structure"][generation]["common_parameters"]:
-                self.dic_common_parameters[generation][parameter] = self.config["structure"][
-                    generation
-                ]["common_parameters"][parameter]
+        if "common_parameters" in dic_generation:
+            dic_common_parameters = dic_generation["common_parameters"]
+            self.dic_common_parameters[generation] = {
+                parameter: dic_common_parameters[parameter] for parameter in dic_common_parameters
+            }
 
         # Check that the generation has scans
-        if (
-            "scans" not in self.config["structure"][generation]
-            or self.config["structure"][generation]["scans"] is None
-        ):
+        if "scans" not in dic_generation or dic_generation["scans"] is None:
             dic_parameter_lists = {"": [generation]}
             dic_parameter_lists_for_naming = {"": [generation]}
             array_conditions = None
@@ -357,7 +437,7 @@ class GenerateScan:
             l_values_path_list = dic_curr_parameter["path_list"]
             parameter_list = list_values_path(l_values_path_list, self.dic_common_parameters)
             dic_parameter_lists_for_naming[parameter] = [
-                f"{n:02d}" for n, path in enumerate(parameter_list)
+                f"{n:02d}" for n in range(len(parameter_list))
             ]
         elif "list" in dic_curr_parameter:
             parameter_list = dic_curr_parameter["list"]
@@ -400,8 +480,8 @@ class GenerateScan:
         dic_subvariables = {}
         dic_parameter_lists = {}
         dic_parameter_lists_for_naming = {}
-        for parameter in self.config["structure"][generation]["scans"]:
-            dic_curr_parameter = self.config["structure"][generation]["scans"][parameter]
+        dic_scans = self.config["structure"][generation]["scans"]
+        for parameter, dic_curr_parameter in dic_scans.items():
 
             # Parse the parameter space
             dic_parameter_lists, dic_parameter_lists_for_naming = self.parse_parameter_space(
@@ -523,38 +603,51 @@ class GenerateScan:
 
         # Generate render write for the parameters parameters
         l_study_path = []
+        l_dic_mutated_parameters = []
         if apply_cartesian_product:
             logging.info(
                 f"Now generation cartesian product of all parameters for generation: {generation}"
             )
-            array_param_values = itertools.product(*dic_parameter_lists.values())
-            array_param_values_for_naming = itertools.product(
-                *dic_parameter_lists_for_naming.values()
+            # Indices of all the combinations of parameters, built at once as a meshgrid (same
+            # ordering as itertools.product), and filtered with the conditions
+            l_parameter_lists = list(dic_parameter_lists.values())
+            l_parameter_lists_for_naming = list(dic_parameter_lists_for_naming.values())
+            array_idx = np.stack(
+                np.meshgrid(*[np.arange(len(x)) for x in l_parameter_lists], indexing="ij"),
+                axis=-1,
+            ).reshape(-1, len(l_parameter_lists))
+            if array_conditions is not None:
+                array_idx = array_idx[array_conditions.reshape(-1)]
+
+            # Parameters values are fetched from the indices, as they can't always be cast
+            # into numpy arrays without changing their type (e.g. mixed lists, dictionnaries)
+            array_param_values = (
+                [l_values[i] for l_values, i in zip(l_parameter_lists, l_idx)]
+                for l_idx in array_idx
+            )
+            array_param_values_for_naming = (
+                [l_values[i] for l_values, i in zip(l_parameter_lists_for_naming, l_idx)]
+                for l_idx in array_idx
             )
-            array_idx = itertools.product(*[range(len(x)) for x in dic_parameter_lists.values()])
         else:
             logging.info(f"Now generation parameters for generation: {generation}")
             array_param_values = [list(x) for x in zip(*dic_parameter_lists.values())]
             array_param_values_for_naming = [
                 list(x) for x in zip(*dic_parameter_lists_for_naming.values())
             ]
-            array_idx = range(len(array_param_values))
+
+        # Compile the template only once for the whole generation
+        template = self.get_template(template_path)
+
+        # Parameter names don't change across the scan, only the values
+        l_prefixes_naming = [f"{parameter}_" for parameter in dic_parameter_lists]
 
         # Loop over the parameters
         to_disk_len = np.sum(array_conditions) if array_conditions is not None else 1
         to_disk_idx = 0
-        for idx, (l_values, l_values_for_naming, l_idx) in enumerate(
-            zip(array_param_values, array_param_values_for_naming, array_idx)
-        ):
-            # Check the idx to keep if conditions are present
-            if array_conditions is not None and not array_conditions[l_idx]:
-                continue
-
+        for l_values, l_values_for_naming in zip(array_param_values, array_param_values_for_naming):
             # Create the path for the study
             dic_mutated_parameters = dict(zip(dic_parameter_lists.keys(), l_values))
-            dic_mutated_parameters_for_naming = dict(
-                zip(dic_parameter_lists.keys(), l_values_for_naming)
-            )
 
             # Handle prefix
             prefix_path = ""
@@ -565,8 +658,8 @@ class GenerateScan:
             # Handle suffix
             suffix_path = "_".join(
                 [
-                    f"{parameter}_{value}"
-                    for parameter, value in dic_mutated_parameters_for_naming.items()
+                    prefix + str(value)
+                    for prefix, value in zip(l_prefixes_naming, l_values_for_naming)
                 ]
             )
             suffix_path = suffix_path.removeprefix("_")
@@ -583,17 +676,57 @@ class GenerateScan:
             if "" in dic_mutated_parameters:
                 dic_mutated_parameters.pop("")
 
-            # Generate the study for current generation
-            self.generate_render_write(
-                generation,
-                path,
-                template_path,
-                depth_gen,
-                dic_mutated_parameters=dic_mutated_parameters,
-            )
-
             # Append the list of study paths to build the tree later on
             l_study_path.append(path)
+            l_dic_mutated_parameters.append(dic_mutated_parameters)
+
+        # Dependencies are the same for all the studies of the generation
+        path_main_configuration, str_dependencies = self.get_dependencies(depth_gen)
+
+        # Render each distinct study file only once (identical files can be shared across the
+        # branches of the tree), the other ones are only written
+        dic_path_to_key = {
+            path: (template_path, self.get_str_parameters(dic_mutated_parameters))
+            for path, dic_mutated_parameters in zip(l_study_path, l_dic_mutated_parameters)
+        }
+        dic_key_to_path_render = {}
+        for path, key_study in dic_path_to_key.items():
+            if key_study not in self.dic_rendered_studies:
+                dic_key_to_path_render.setdefault(key_study, path)
+        set_path_render = set(dic_key_to_path_render.values())
+
+        # Write the files in parallel threads, as writing is I/O-bound (especially on AFS/EOS)
+        with ThreadPoolExecutor() as executor:
+            dic_futures = {
+                key_study: executor.submit(
+                    self.generate_render_write,
+                    generation,
+                    path,
+                    template_path,
+                    key_study[1],
+                    path_main_configuration,
+                    str_dependencies,
+                    template=template,
+                )
+                for key_study, path in dic_key_to_path_render.items()
+            }
+            # Cache the rendered files, and propagate potential exceptions
+            for key_study, future in dic_futures.items():
+                self.dic_rendered_studies[key_study] = future.result()
+
+            # Write the remaining (already rendered) files
+            l_futures = [
+                executor.submit(
+                    self.write,
+                    self.dic_rendered_studies[dic_path_to_key[path]],
+                    os.path.join(path, f"{generation}.py"),
+                    format_with_black=False,
+                )
+                for path in l_study_path
+                if path not in set_path_render
+            ]
+            for future in l_futures:
+                future.result()
 
         if not l_study_path:
             logging.warning(
@@ -618,27 +751,53 @@ class GenerateScan:
             dict: The updated dictionary representing the study tree structure.
         """
         logging.info(f"Completing the tree structure for generation: {gen}")
+        # Consecutive paths usually share the same parent (they come from the same scan), so the
+        # parent node is only looked up again when it changes
+        l_keys_parent_previous = None
+        dic_parent = dictionary_tree
         for path_next in l_study_path_next_gen:
-            nested_set(
-                dictionary_tree,
-                path_next.split("/")[1:-1] + [gen],
-                {"file": f"{path_next}{gen}.py"},
-            )
+            l_keys = path_next.split("/")[1:-1]
+            l_keys_parent = l_keys[:-1]
+            if l_keys_parent != l_keys_parent_previous:
+                dic_parent = dictionary_tree
+                for key in l_keys_parent:
+                    dic_parent = dic_parent.setdefault(key, {})
+                l_keys_parent_previous = l_keys_parent
+            dic_parent.setdefault(l_keys[-1], {})[gen] = {"file": f"{path_next}{gen}.py"}
 
         return dictionary_tree
 
     def write_tree(self, dictionary_tree: dict):
         """
-        Writes the study tree structure to a YAML file.
+        Writes the study tree structure to a YAML file, or to a JSON file (much faster to write and
+        read for large studies) if emit_yaml_tree is set to False in the scan configuration. The
+        file is written to self.path_tree in both cases.
 
         Args:
             dictionary_tree (dict): The dictionary representing the study tree structure.
         """
-        logging.info("Writing the tree structure to a YAML file.")
-        ryaml = yaml.YAML()
-        with open(self.path_tree, "w") as yaml_file:
+        if self.emit_yaml_tree:
+            logging.info("Writing the tree structure to a YAML file.")
+            ryaml = yaml.YAML()
             ryaml.indent(sequence=4, offset=2)
-            ryaml.dump(dictionary_tree, yaml_file)
+            # Dump in memory first, such that the file is written at once rather than in many small
+            # chunks (which is slow on network filesystems)
+            stream = io.StringIO()
+            ryaml.dump(dictionary_tree, stream)
+            with open(self.path_tree, "w") as yaml_file:
+                yaml_file.write(stream.getvalue())
+            return
+
+        logging.info("Writing the tree structure to a JSON file.")
+        # Use orjson if available, as it's much faster for large trees
+        try:
+            import orjson
+
+            with open(self.path_tree, "wb") as json_file:
+                json_file.write(orjson.dumps(dictionary_tree, option=orjson.OPT_INDENT_2))
+        except ImportError:
+            with open(self.path_tree, "w") as json_file:
+                json_file.write(json.dumps(dictionary_tree, indent=2))
 
     def create_study_for_current_gen(
         self,
@@ -668,14 +827,11 @@ class GenerateScan:
             tuple[list[str], list[str]]: The list of study file strings and the list of study paths.
         """
         executable_path = self.config["structure"][generation]["executable"]
-        path_local_template = (
-            f"{os.path.dirname(inspect.getfile(GenerateScan))}/../assets/template_scripts/"
-        )
 
         # Check if the executable path corresponds to a file
         if not os.path.isfile(executable_path):
             # Check if the executable path corresponds to a file in the template folder
-            executable_path_template = f"{path_local_template}{executable_path}"
+            executable_path_template = f"{PATH_TEMPLATE_SCRIPTS}{executable_path}"
             if not os.path.isfile(executable_path_template):
                 raise FileNotFoundError(
                     f"Executable file {executable_path} not found locally nor in the study-da "
@@ -716,20 +872,25 @@ class GenerateScan:
         for idx, generation in enumerate(l_generations):
             l_study_path_all_next_generation = []
             logging.info(f"Taking care of generation: {generation}")
-            for study_path in l_study_path:
-                if dic_parameter_all_gen is None or generation not in dic_parameter_all_gen:
-                    dic_parameter_current_gen = None
-                    dic_parameter_naming_current_gen = None
+
+            # Rendered files can't be shared across generations, free the memory
+            self.dic_rendered_studies = {}
+
+            # External parameters (if any) are the same for all the studies of the generation
+            if dic_parameter_all_gen is None or generation not in dic_parameter_all_gen:
+                dic_parameter_current_gen = None
+                dic_parameter_naming_current_gen = None
+            else:
+                dic_parameter_current_gen = dic_parameter_all_gen[generation]
+                if (
+                    dic_parameter_all_gen_naming is not None
+                    and generation in dic_parameter_all_gen_naming
+                ):
+                    dic_parameter_naming_current_gen = dic_parameter_all_gen_naming[generation]
                 else:
-                    dic_parameter_current_gen = dic_parameter_all_gen[generation]
-                    if (
-                        dic_parameter_all_gen_naming is not None
-                        and generation in dic_parameter_all_gen_naming
-                    ):
-                        dic_parameter_naming_current_gen = dic_parameter_all_gen_naming[generation]
-                    else:
-                        dic_parameter_naming_current_gen = None
+                    dic_parameter_naming_current_gen = None
 
+            for study_path in l_study_path:
                 # Get list of paths for the children of the current study
                 l_study_path_next_generation = self.create_study_for_current_gen(
                     generation,
@@ -807,7 +968,7 @@ class GenerateScan:
                 # Check if the dependency exists as a file
                 if not os.path.isfile(path):
                     # Check if the dependency exists as a file in the template folder
-                    path_template = f"{os.path.dirname(inspect.getfile(GenerateScan))}/../assets/configurations/{path}"
+                    path_template = f"{PATH_TEMPLATE_CONFIGURATIONS}{path}"
                     if not os.path.isfile(path_template):
                         raise FileNotFoundError(
                             f"Dependency file {path} not found locally nor in the study-da "
@@ -874,15 +1035,18 @@ class GenerateScan:
             for concomitant_parameters in ll_concomitant_parameters
         ]
 
-        # Browse all the values of array_conditions
-        for idx, _ in np.ndenumerate(array_conditions):
-            # Check if the value is on the diagonal of the concomitant parameters
-            for l_idx_concomitant_parameter in ll_idx_concomitant_parameters:
-                if any(
-                    idx[i] != idx[j]
-                    for i, j in itertools.combinations(l_idx_concomitant_parameter, 2)
-                ):
-                    array_conditions[idx] = False
-                    break
+        # Only keep the values on the diagonal of the concomitant parameters. The diagonal mask is
+        # built by broadcasting the indices of each pair of dimensions against each other, rather
+        # than by browsing all the values of array_conditions
+        shape = array_conditions.shape
+        for l_idx_concomitant_parameter in ll_idx_concomitant_parameters:
+            for i, j in itertools.combinations(l_idx_concomitant_parameter, 2):
+                shape_i = [1] * len(shape)
+                shape_i[i] = shape[i]
+                shape_j = [1] * len(shape)
+                shape_j[j] = shape[j]
+                array_conditions &= np.arange(shape[i]).reshape(shape_i) == np.arange(
+                    shape[j]
+                ).reshape(shape_j)
 
         return array_conditions
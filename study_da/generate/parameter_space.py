@@ -42,7 +42,7 @@ def convert_for_subvariables(l_subvariables: list[str], parameter_list: list) ->
     Returns:
         list: List of dictionaries with subvariables as keys.
     """
-    return [{subvar: value for subvar in l_subvariables} for value in parameter_list]
+    return [dict.fromkeys(l_subvariables, value) for value in parameter_list]
 
 
 def linspace(l_values_linspace: list) -> np.ndarray:
@@ -59,15 +59,14 @@ def linspace(l_values_linspace: list) -> np.ndarray:
         raise ValueError(
             "All values in the list for the linspace function must be floats or integers."
         )
-    return np.round(
-        np.linspace(
-            l_values_linspace[0],
-            l_values_linspace[1],
-            l_values_linspace[2],
-            endpoint=True,
-        ),
-        8,
+    array_values = np.linspace(
+        l_values_linspace[0],
+        l_values_linspace[1],
+        l_values_linspace[2],
+        endpoint=True,
     )
+    # Round in place to avoid allocating a second array
+    return np.round(array_values, 8, out=array_values)
 
 
 def logspace(l_values_logspace: list) -> np.ndarray:
@@ -85,15 +84,14 @@ def logspace(l_values_logspace: list) -> np.ndarray:
         raise ValueError(
             "All values in the list for the logspace function must be floats or integers."
         )
-    return np.round(
-        np.logspace(
-            l_values_logspace[0],
-            l_values_logspace[1],
-            l_values_logspace[2],
-            endpoint=True,
-        ),
-        8,
+    array_values = np.logspace(
+        l_values_logspace[0],
+        l_values_logspace[1],
+        l_values_logspace[2],
+        endpoint=True,
     )
+    # Round in place to avoid allocating a second array
+    return np.round(array_values, 8, out=array_values)
 
 
 def list_values_path(
@@ -117,4 +115,8 @@ def list_values_path(
     n_path = find_item_in_dic(dic_common_parameters, n_path_arg)
     if n_path is None:
         raise ValueError(f"Parameter {n_path_arg} is not defined in the scan configuration.")
-    return [l_values_path_list[0].replace("____", f"{n:02d}") for n in range(n_path)]
+    # Turn the initial path into a format string once (escaping potential braces in the path)
+    path_format = (
+        l_values_path_list[0].replace("{", "{{").replace("}", "}}").replace("____", "{0:02d}")
+    )
+    return [path_format.format(n) for n in range(n_path)]
@@ -7,7 +7,28 @@ from typing import Any, Optional
 
 # Local imports
 from .generate.generate_scan import GenerateScan
-from .submit.submit_scan import SubmitScan
+
+
+# ==================================================================================================
+# --- Lazy imports
+# ==================================================================================================
+def __getattr__(name: str) -> Any:
+    """
+    Imports the submission module only when SubmitScan is accessed, as it is not required to create
+    a study.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Any: The requested attribute.
+    """
+    if name == "SubmitScan":
+        from .submit.submit_scan import SubmitScan
+
+        return SubmitScan
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ==================================================================================================
 # --- Main functions
@@ -39,7 +60,7 @@ def create(
     Returns:
         tuple[str, str]: The path to the tree file and the name of the main configuration file.
     """
-    logging.info(f"Create study from configuration file: {path_config_scan}")
+    logging.info("Create study from configuration file: %s", path_config_scan)
     study = GenerateScan(path_config=path_config_scan)
     study.create_study(
         force_overwrite=force_overwrite,
@@ -81,29 +102,24 @@ def create_single_job(
     Returns:
         str: The path to the tree file.
     """
-    # Generate the scan dictionnary
+    # Generate the scan dictionnary, skipping the generations without executable
+    l_executables = [
+        ("generation_1", name_executable_generation_1),
+        ("generation_2", name_executable_generation_2),
+        ("generation_3", name_executable_generation_3),
+    ]
     dic_scan = {
         "name": name_study,
         "dependencies": {"main_configuration": name_main_configuration},
         "structure": {
-            "generation_1": {
-                "executable": name_executable_generation_1,
-            },
+            generation: {"executable": executable}
+            for generation, executable in l_executables
+            if executable is not None
         },
     }
 
-    if name_executable_generation_2 is not None:
-        dic_scan["structure"]["generation_2"] = {
-            "executable": name_executable_generation_2,
-        }
-
-    if name_executable_generation_3 is not None:
-        dic_scan["structure"]["generation_3"] = {
-            "executable": name_executable_generation_3,
-        }
-
     # Create the study
-    logging.info(f"Create single job study: {name_study}")
+    logging.info("Create single job study: %s", name_study)
     study = GenerateScan(dic_scan=dic_scan)
     study.create_study(
         force_overwrite=force_overwrite,
@@ -171,6 +187,9 @@ def submit(
     Returns:
         None
     """
+    # Import the submission module only when needed, as it is not required to create a study
+    from .submit.submit_scan import SubmitScan
+
     # Instantiate the study (does not affect already existing study)
     study_sub = SubmitScan(
         path_tree=path_tree,
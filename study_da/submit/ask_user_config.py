@@ -1,6 +1,11 @@
 """
 This module contains functions to prompt the user for various job configuration settings.
 
+The answers can also be provided through the environment variables STUDY_DA_REQUEST_GPU (y/n),
+STUDY_DA_SUBMISSION_TYPE (e.g. htc), STUDY_DA_HTC_FLAVOR (e.g. espresso), STUDY_DA_KEEP_SETTING
+(y/n) and STUDY_DA_SKIP_CONFIGURED_JOBS (y/n), in which case the corresponding question is not
+asked. This allows to configure the jobs non-interactively.
+
 Functions:
     ask_and_set_gpu(dic_gen: dict[str, Any]) -> None:
 
@@ -17,12 +22,58 @@ Functions:
 # --- Imports
 # ==================================================================================================
 # Standard library imports
+import logging
+import os
 from typing import Any
 
+# ==================================================================================================
+# --- Constants
+# ==================================================================================================
+# Possible answers to the multiple-choice questions, in the order in which they are proposed
+HTC_FLAVOURS = (
+    "espresso",
+    "microcentury",
+    "longlunch",
+    "workday",
+    "tomorrow",
+    "testmatch",
+    "nextweek",
+)
+SUBMISSION_TYPES = ("local", "htc", "htc_docker", "slurm", "slurm_docker")
+
+# Numbered list of the choices, as displayed in the questions
+PROMPT_HTC_FLAVOURS = ", ".join(f"{idx}: {name}" for idx, name in enumerate(HTC_FLAVOURS, 1))
+PROMPT_SUBMISSION_TYPES = ", ".join(
+    f"{idx}: {name}" for idx, name in enumerate(SUBMISSION_TYPES, 1)
+)
+
 
 # ==================================================================================================
 # --- Functions
 # ==================================================================================================
+def _get_answer_from_env(name_env: str, l_valid_answers: list[str]) -> str | None:
+    """
+    Gets the answer to a question from an environment variable, if it is set and valid.
+
+    Args:
+        name_env (str): The name of the environment variable.
+        l_valid_answers (list[str]): The list of valid answers.
+
+    Returns:
+        str | None: The answer, or None if the question must be asked to the user.
+    """
+    answer = os.environ.get(name_env)
+    if answer is None:
+        return None
+    if answer not in l_valid_answers:
+        logging.warning(
+            f"Invalid value {answer} for {name_env}, must be one of {l_valid_answers}. The question"
+            " will be asked instead."
+        )
+        return None
+    return answer
+
+
 def ask_and_set_gpu(dic_gen: dict[str, Any]) -> None:
     """
     Prompts the user if a GPU must be used for the job and sets it in the provided dictionary.
@@ -30,6 +81,12 @@ def ask_and_set_gpu(dic_gen: dict[str, Any]) -> None:
     Args:
         dic_gen (dict[str, Any]): The dictionary containing job configuration.
     """
+    # Skip the question if the answer is provided through the environment
+    gpu = _get_answer_from_env("STUDY_DA_REQUEST_GPU", ["y", "n"])
+    if gpu is not None:
+        dic_gen["request_gpu"] = gpu == "y"
+        return
+
     while True:
         gpu = input(
             f"Do you want to request a GPU for job {dic_gen['file']}?" " (y/n). Default is n."
@@ -48,31 +105,27 @@ def ask_and_set_htc_flavour(dic_gen: dict[str, Any]) -> None:
     Args:
         dic_gen (dict[str, Any]): The dictionary containing job configuration.
     """
+    # Skip the question if the answer is provided through the environment
+    flavour = _get_answer_from_env("STUDY_DA_HTC_FLAVOR", list(HTC_FLAVOURS))
+    if flavour is not None:
+        dic_gen["htc_flavor"] = flavour
+        return
+
     while True:
         try:
             submission_type = input(
                 f"What type of htc job flavour do you want to use for job {dic_gen['file']}?"
-                f" 1: espresso, 2: microcentury, 3: longlunch, 4: workday, 5: tomorrow,"
-                f" 6: testmatch, 7: nextweek. Default is espresso."
+                f" {PROMPT_HTC_FLAVOURS}. Default is espresso."
             )
             submission_type = 1 if submission_type == "" else int(submission_type)
-            if submission_type in range(1, 8):
+            if 1 <= submission_type <= len(HTC_FLAVOURS):
                 break
             else:
                 raise ValueError
         except ValueError:
-            print("Invalid input. Please enter a number between 1 and 7.")
+            print(f"Invalid input. Please enter a number between 1 and {len(HTC_FLAVOURS)}.")
 
-    dict_flavour_type = {
-        1: "espresso",
-        2: "microcentury",
-        3: "longlunch",
-        4: "workday",
-        5: "tomorrow",
-        6: "testmatch",
-        7: "nextweek",
-    }
-    dic_gen["htc_flavor"] = dict_flavour_type[submission_type]
+    dic_gen["htc_flavor"] = HTC_FLAVOURS[submission_type - 1]
 
 
 def ask_and_set_run_on(dic_gen: dict[str, Any]) -> None:
@@ -82,28 +135,27 @@ def ask_and_set_run_on(dic_gen: dict[str, Any]) -> None:
     Args:
         dic_gen (dict[str, Any]): The dictionary containing job configuration.
     """
+    # Skip the question if the answer is provided through the environment
+    run_on = _get_answer_from_env("STUDY_DA_SUBMISSION_TYPE", list(SUBMISSION_TYPES))
+    if run_on is not None:
+        dic_gen["submission_type"] = run_on
+        return
+
     while True:
         try:
             submission_type = input(
                 f"What type of submission do you want to use for job {dic_gen['file']}?"
-                " 1: local, 2: htc, 3: htc_docker, 4: slurm, 5: slurm_docker. Default is local."
+                f" {PROMPT_SUBMISSION_TYPES}. Default is local."
             )
             submission_type = 1 if submission_type == "" else int(submission_type)
-            if submission_type in range(1, 6):
+            if 1 <= submission_type <= len(SUBMISSION_TYPES):
                 break
             else:
                 raise ValueError
         except ValueError:
-            print("Invalid input. Please enter a number between 1 and 5.")
+            print(f"Invalid input. Please enter a number between 1 and {len(SUBMISSION_TYPES)}.")
 
-    dict_submission_type = {
-        1: "local",
-        2: "htc",
-        3: "htc_docker",
-        4: "slurm",
-        5: "slurm_docker",
-    }
-    dic_gen["submission_type"] = dict_submission_type[submission_type]
+    dic_gen["submission_type"] = SUBMISSION_TYPES[submission_type - 1]
 
 
 def ask_keep_setting(job_name: str) -> bool:
@@ -113,6 +165,11 @@ def ask_keep_setting(job_name: str) -> bool:
     Returns:
         bool: True if the user wants to keep the same settings, False otherwise.
     """
+    # Skip the question if the answer is provided through the environment
+    keep_setting = _get_answer_from_env("STUDY_DA_KEEP_SETTING", ["y", "n"])
+    if keep_setting is not None:
+        return keep_setting == "y"
+
     keep_setting = input(
         f"Do you want to keep the same setting for all jobs of the type {job_name} ? (y/n)."
         f"Default is y."
@@ -131,6 +188,11 @@ def ask_skip_configured_jobs() -> bool:
     Returns:
         bool: True if the user wants to skip already configured jobs, False otherwise.
     """
+    # Skip the question if the answer is provided through the environment
+    skip_configured_jobs = _get_answer_from_env("STUDY_DA_SKIP_CONFIGURED_JOBS", ["y", "n"])
+    if skip_configured_jobs is not None:
+        return skip_configured_jobs == "y"
+
     skip_configured_jobs = input(
         "Some jobs to submit seem to be configured already. Do you want to skip them? (y/n). "
         "Default is y."
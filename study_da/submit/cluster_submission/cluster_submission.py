@@ -5,20 +5,45 @@
 # ==================================================================================================
 # Standard library imports
 import copy
+import getpass
 import logging
 import os
+import re
+import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import psutil
 
 # Third party imports
-from study_da.utils import nested_get, nested_set
+from study_da.utils import nested_get
 
 # Local imports
 from .submission_statements import HTC, HTCDocker, LocalPC, Slurm, SlurmDocker
 
+# ==================================================================================================
+# --- Constants
+# ==================================================================================================
+# Regular expressions to get the job ids from the (raw) output of the submission commands
+RE_JOB_ID_HTC = re.compile(rb"cluster (\d+)")
+RE_JOB_ID_SLURM = re.compile(rb"Submitted batch job (\d+)")
+
+# Regular expression to get the folder of a job from the details returned by scontrol
+RE_SLURM_JOB_FOLDER = re.compile(
+    r"Command=(?P<command>[^\n]*?)run\.sh|StdOut=(?P<stdout>[^\n]*?)output\.txt"
+)
+
+# Statuses of the Condor jobs (JobStatus attribute) that are considered
+DIC_CONDOR_JOB_STATUS = {2: "running", 1: "queuing"}
+
+# Statuses of the Slurm jobs (compact state returned by squeue) that are considered
+DIC_SLURM_JOB_STATUS = {"R": "running", "PD": "queuing"}
+
+# Maximum number of simultaneous queries when jobs must be queried individually
+MAX_SIMULTANEOUS_QUERIES = 8
+
 
 # ==================================================================================================
 # --- Class for job submission
@@ -35,7 +60,12 @@ class ClusterSubmission:
         dic_tree (dict): A dictionary representing the job tree.
         path_submission_file (str): The path to the submission file.
         abs_path_study (str): The absolute path to the study.
-        dic_submission (dict): A dictionary mapping submission types to their corresponding classes.
+        dic_submission (dict): A dictionary mapping submission types to their corresponding classes,
+            shared across all instances.
+        dic_subdic_job (dict): A dictionary mapping the jobs to submit to their sub-dictionary in the
+            tree.
+        dic_jobs_to_submit (dict): A dictionary mapping each submission type to the list of jobs to
+            submit with it.
 
     Methods:
         dic_id_to_path_job() -> dict | None:
@@ -50,22 +80,31 @@ class ClusterSubmission:
             not mixed.
         _get_state_jobs(verbose: bool = True) -> tuple[list[str], list[str]]:
             Gets the current state of the jobs (running and queuing).
-        _test_job(job: str, path_job: str, running_jobs: list[str], queuing_jobs: list[str]) -> bool:
+        _test_job(job: str, path_job: str, running_jobs: set[str], queuing_jobs: set[str]) -> bool:
             Tests if a job is completed, running, or queuing.
+        _filter_jobs_to_submit(list_of_jobs: list[str], running_jobs: set[str],
+            queuing_jobs: set[str]) -> list[tuple[int, str]]:
+            Filters the jobs to keep only the ones that must be (re)submitted.
         _return_htc_flavour(job: str) -> str:
             Returns the HTC flavor for a given job.
         _return_abs_path_job(job: str) -> tuple[str, str]:
             Returns the absolute path of a job.
-        _write_sub_files_slurm_docker(sub_filename: str, running_jobs: list[str],
-            queuing_jobs: list[str], list_of_jobs: list[str]) -> tuple[list[str], list[str]]:
+        _ensure_dir(path_dir: str) -> None:
+            Creates a folder if it does not exist, checking each folder only once.
+        _write_sub_files_slurm_docker(sub_filename: str, running_jobs: set[str],
+            queuing_jobs: set[str], list_of_jobs: list[str]) -> tuple[list[str], list[str]]:
             Writes submission files for Slurm Docker jobs.
+        _write_sub_file_slurm_docker(Sub: SlurmDocker) -> str:
+            Writes the submission file of a Slurm Docker job.
         _get_Sub(job: str, submission_type: str, sub_filename: str, abs_path_job: str,
             gpu: bool) -> LocalPC | HTC | HTCDocker | Slurm | SlurmDocker:
             Returns the appropriate submission object based on the submission type.
-        _write_sub_file(sub_filename: str, running_jobs: list[str], queuing_jobs: list[str],
+        _get_path_image() -> str:
+            Returns the path to the container image, checking that it is defined in the tree.
+        _write_sub_file(sub_filename: str, running_jobs: set[str], queuing_jobs: set[str],
             list_of_jobs: list[str], submission_type: str) -> tuple[list[str], list[str]]:
             Writes a submission file for the given jobs.
-        _write_sub_files(sub_filename: str, running_jobs: list[str], queuing_jobs: list[str],
+        _write_sub_files(sub_filename: str, running_jobs: set[str], queuing_jobs: set[str],
             list_of_jobs: list[str], submission_type: str) -> tuple[list[str], list[str]]:
             Writes submission files for the given jobs based on the submission type.
         write_sub_files() -> dict:
@@ -75,20 +114,45 @@ class ClusterSubmission:
             dic_id_to_path_job_temp: dict, list_of_jobs: list[str], idx_submission: int = 0)
                 -> tuple[dict, int]:
             Updates the job status from the HPC output.
+        _write_launcher_slurm_docker(l_submission_filenames: list[str]) -> str:
+            Writes a script submitting all the Slurm Docker submission files at once.
         submit(list_of_jobs: list[str], l_submission_filenames: list[str], submission_type: str)
             -> None:
             Submits the jobs to the appropriate cluster system.
         _get_local_jobs() -> list[str]:
             Gets the list of local jobs.
-        _get_condor_jobs(status: str, force_query_individually: bool = False) -> list[str]:
-            Gets the list of Condor jobs based on the status.
-        _get_slurm_jobs(status: str, force_query_individually: bool = False) -> list[str]:
-            Gets the list of Slurm jobs based on the status.
+        _get_processes_cmdline() -> list[list[str]]:
+            Gets the command lines of the current processes that may run a job.
+        _get_condor_jobs(force_query_individually: bool = False) -> tuple[list[str], list[str]]:
+            Gets the lists of running and queuing Condor jobs.
+        _get_condor_jobs_status() -> list[tuple[int, str]]:
+            Gets the ids and statuses of the running and queuing Condor jobs.
+        _get_condor_jobs_path() -> dict[int, str]:
+            Gets the path of all the Condor jobs of the study from their command.
+        _get_slurm_jobs(force_query_individually: bool = False) -> tuple[list[str], list[str]]:
+            Gets the lists of running and queuing Slurm jobs.
+        _get_slurm_jobs_path(username: str) -> dict[int, str | None]:
+            Gets the path of all the Slurm jobs run from a run.sh script from their command.
+        _get_slurm_job_path(jobid: int) -> str | None:
+            Gets the path of a Slurm job from its details.
+        querying_all_jobs(check_local: bool, check_htc: bool, check_slurm: bool)
+            -> tuple[list[str], list[str]]:
+            Queries the running and queuing jobs based on the submission type.
         querying_jobs(check_local: bool, check_htc: bool, check_slurm: bool,
             status: str = "running") -> list[str]:
             Queries the jobs based on the submission type and status.
     """
 
+    # Submission classes, per submission type. Shared across all instances, as it doesn't depend on
+    # the study
+    dic_submission: dict = {
+        "local": LocalPC,
+        "htc": HTC,
+        "htc_docker": HTCDocker,
+        "slurm": Slurm,
+        "slurm_docker": SlurmDocker,
+    }
+
     def __init__(
         self,
         study_name: str,
@@ -104,13 +168,53 @@ class ClusterSubmission:
         self.dic_tree: dict = dic_tree
         self.path_submission_file: str = path_submission_file
         self.abs_path_study: str = abs_path_study
-        self.dic_submission: dict = {
-            "local": LocalPC,
-            "htc": HTC,
-            "htc_docker": HTCDocker,
-            "slurm": Slurm,
-            "slurm_docker": SlurmDocker,
+
+        # Sub-dictionaries of the jobs to submit in the tree, such that the tree doesn't need to be
+        # browsed from the root every time a job attribute is needed
+        self.dic_subdic_job: dict[str, dict] = {
+            job: nested_get(dic_tree, dic_all_jobs[job]["l_keys"]) for job in l_jobs_to_submit
+        }
+
+        # Jobs to submit, partitioned by submission type (in the same pass as above)
+        self.dic_jobs_to_submit: dict[str, list[str]] = {key: [] for key in self.dic_submission}
+        for job in l_jobs_to_submit:
+            submission_type = self.dic_subdic_job[job]["submission_type"]
+            self.dic_jobs_to_submit.setdefault(submission_type, []).append(job)
+
+        # Path to the container image, set when the first docker job is written
+        self.path_image: str | None = None
+
+        # Functions building the submission object of a job, per submission type
+        self._dic_build_Sub = {
+            "local": lambda job, sub_filename, abs_path_job, gpu: LocalPC(
+                sub_filename, abs_path_job
+            ),
+            "htc": lambda job, sub_filename, abs_path_job, gpu: HTC(
+                sub_filename, abs_path_job, gpu, self._return_htc_flavour(job)
+            ),
+            "htc_docker": lambda job, sub_filename, abs_path_job, gpu: HTCDocker(
+                sub_filename,
+                abs_path_job,
+                gpu,
+                self._get_path_image(),
+                self._return_htc_flavour(job),
+            ),
+            "slurm": lambda job, sub_filename, abs_path_job, gpu: Slurm(
+                sub_filename, abs_path_job, gpu
+            ),
+            "slurm_docker": lambda job, sub_filename, abs_path_job, gpu: SlurmDocker(
+                sub_filename, abs_path_job, gpu, self._get_path_image()
+            ),
         }
+
+        # Cache of the relative and absolute paths of the jobs
+        self._dic_path_job_cache: dict[str, tuple[str, str]] = {}
+
+        # Cache of the mapping between job ids and job paths (None until computed from the tree)
+        self._dic_id_to_path_job_cache: dict[int, str] | None = None
+
+        # Folders already created (or checked to exist) for the submission files
+        self._set_ensured_dirs: set[str] = set()
         """
         Initialize the ClusterSubmission class.
 
@@ -131,21 +235,24 @@ class ClusterSubmission:
 
         This method iterates over the list of jobs to submit and constructs a dictionary
         where the keys are job IDs and the values are the absolute paths to the jobs.
-        If no job IDs are found, the method returns None.
+        If no job IDs are found, the method returns None. The dictionary is only built from the
+        tree once, and then kept up to date by the setter. A copy is returned, such that it can
+        safely be mutated.
 
         Returns:
             dict | None: A dictionary mapping job IDs to job paths, or None if no job IDs are found.
         """
-        dic_id_to_path_job = {}
-        found_at_least_one = False
-        for job in self.l_jobs_to_submit:
-            l_keys = self.dic_all_jobs[job]["l_keys"]
-            subdic_job = nested_get(self.dic_tree, l_keys)
-            if "id_sub" in subdic_job:
-                dic_id_to_path_job[subdic_job["id_sub"]] = self._return_abs_path_job(job)[0]
-                found_at_least_one = True
-
-        return dic_id_to_path_job if found_at_least_one else None
+        if self._dic_id_to_path_job_cache is None:
+            dic_id_to_path_job = {}
+            for job in self.l_jobs_to_submit:
+                subdic_job = self.dic_subdic_job[job]
+                if "id_sub" in subdic_job:
+                    # Ids are always integers, as the ones returned by the schedulers
+                    path_job = self._return_abs_path_job(job)[0]
+                    dic_id_to_path_job[int(subdic_job["id_sub"])] = path_job
+            self._dic_id_to_path_job_cache = dic_id_to_path_job
+
+        return dict(self._dic_id_to_path_job_cache) if self._dic_id_to_path_job_cache else None
 
     # Setter for dic_id_to_path_job
     @dic_id_to_path_job.setter
@@ -168,23 +275,30 @@ class ClusterSubmission:
             - If a job's ID is not found in the dictionary, it is removed from the tree.
         """
         assert isinstance(dic_id_to_path_job, dict)
-        # Ensure all ids are integers
-        dic_id_to_path_job = {
-            int(id_job): path_job for id_job, path_job in dic_id_to_path_job.items()
-        }
-        dic_job_to_id = {path_job: int(id_job) for id_job, path_job in dic_id_to_path_job.items()}
-
-        # Update the tree
+        # Ensure all ids are integers, and build the mapping from job paths to ids in the same pass
+        set_id_job = set()
+        dic_job_to_id = {}
+        for id_job, path_job in dic_id_to_path_job.items():
+            id_job = int(id_job)
+            set_id_job.add(id_job)
+            dic_job_to_id[path_job] = id_job
+
+        # Update the tree, and the cache with the resulting mapping
+        dic_id_to_path_job_cache = {}
         for job in self.l_jobs_to_submit:
             path_job = self._return_abs_path_job(job)[0]
-            l_keys = self.dic_all_jobs[job]["l_keys"]
-            subdic_job = nested_get(self.dic_tree, l_keys)
-            if "id_sub" in subdic_job and int(subdic_job["id_sub"]) not in dic_id_to_path_job:
+            subdic_job = self.dic_subdic_job[job]
+            if "id_sub" in subdic_job and int(subdic_job["id_sub"]) not in set_id_job:
                 del subdic_job["id_sub"]
             elif "id_sub" not in subdic_job and path_job in dic_job_to_id:
                 subdic_job["id_sub"] = dic_job_to_id[path_job]
             # Else all is consistent
 
+            if "id_sub" in subdic_job:
+                dic_id_to_path_job_cache[int(subdic_job["id_sub"])] = path_job
+
+        self._dic_id_to_path_job_cache = dic_id_to_path_job_cache
+
     def _update_dic_id_to_path_job(self, running_jobs: list[str], queuing_jobs: list[str]) -> None:
         """
         Updates the dictionary `dic_id_to_path_job` by removing jobs that are no longer running or
@@ -197,16 +311,20 @@ class ClusterSubmission:
         Returns:
             None
         """
+        dic_id_to_path_job = self.dic_id_to_path_job
+        if dic_id_to_path_job is None:
+            return
+
         # Look for jobs in the dictionnary that are not running or queuing anymore
-        set_current_jobs = set(running_jobs + queuing_jobs)
-        if self.dic_id_to_path_job is not None:
-            dic_id_to_path_job = self.dic_id_to_path_job
-            for id_job, job in self.dic_id_to_path_job.items():
-                if job not in set_current_jobs:
-                    del dic_id_to_path_job[id_job]
-
-            # Update dic_id_to_path_job
-            self.dic_id_to_path_job = dic_id_to_path_job
+        set_current_jobs = set(running_jobs)
+        set_current_jobs.update(queuing_jobs)
+        dic_id_to_path_job_filtered = {
+            id_job: job for id_job, job in dic_id_to_path_job.items() if job in set_current_jobs
+        }
+
+        # Update dic_id_to_path_job (only if some jobs are gone, the tree is unchanged otherwise)
+        if len(dic_id_to_path_job_filtered) != len(dic_id_to_path_job):
+            self.dic_id_to_path_job = dic_id_to_path_job_filtered
 
     def _check_submission_type(self) -> tuple[bool, bool, bool]:
         """
@@ -223,18 +341,12 @@ class ClusterSubmission:
         Raises:
             ValueError: If both HTC and Slurm submission types are found in the jobs to submit.
         """
-        check_local = False
-        check_htc = False
-        check_slurm = False
-        for job in self.l_jobs_to_submit:
-            l_keys = self.dic_all_jobs[job]["l_keys"]
-            submission_type = nested_get(self.dic_tree, l_keys + ["submission_type"])
-            if submission_type == "local":
-                check_local = True
-            elif submission_type in ["htc", "htc_docker"]:
-                check_htc = True
-            elif submission_type in ["slurm", "slurm_docker"]:
-                check_slurm = True
+        # Use the jobs already partitioned by submission type
+        check_local = bool(self.dic_jobs_to_submit["local"])
+        check_htc = bool(self.dic_jobs_to_submit["htc"] or self.dic_jobs_to_submit["htc_docker"])
+        check_slurm = bool(
+            self.dic_jobs_to_submit["slurm"] or self.dic_jobs_to_submit["slurm_docker"]
+        )
 
         if check_htc and check_slurm:
             raise ValueError("Error: Mixing htc and slurm submission is not allowed")
@@ -260,9 +372,8 @@ class ClusterSubmission:
         # First check whether the jobs are submitted on local, htc or slurm
         check_local, check_htc, check_slurm = self._check_submission_type()
 
-        # Then query accordingly
-        running_jobs = self.querying_jobs(check_local, check_htc, check_slurm, status="running")
-        queuing_jobs = self.querying_jobs(check_local, check_htc, check_slurm, status="queuing")
+        # Then query accordingly (both statuses at once)
+        running_jobs, queuing_jobs = self.querying_all_jobs(check_local, check_htc, check_slurm)
         self._update_dic_id_to_path_job(running_jobs, queuing_jobs)
         if verbose:
             logging.info("Running: \n" + "\n".join(running_jobs))
@@ -270,7 +381,7 @@ class ClusterSubmission:
         return running_jobs, queuing_jobs
 
     def _test_job(
-        self, job: str, path_job: str, running_jobs: list[str], queuing_jobs: list[str]
+        self, job: str, path_job: str, running_jobs: set[str], queuing_jobs: set[str]
     ) -> bool:
         """
         Tests the status of a job and determines if it needs to be (re)submitted.
@@ -278,16 +389,16 @@ class ClusterSubmission:
         Args:
             job (str): The job identifier.
             path_job (str): The path to the job.
-            running_jobs (list[str]): A list of currently running jobs.
-            queuing_jobs (list[str]): A list of currently queuing jobs.
+            running_jobs (set[str]): The set of currently running jobs.
+            queuing_jobs (set[str]): The set of currently queuing jobs.
 
         Returns:
             bool: True if the job must be (re)submitted, False otherwise.
         """
         # Test if job is completed
-        l_keys = self.dic_all_jobs[job]["l_keys"]
-        completed = nested_get(self.dic_tree, l_keys + ["status"]) == "finished"
-        failed = nested_get(self.dic_tree, l_keys + ["status"]) == "failed"
+        status = self.dic_subdic_job[job]["status"]
+        completed = status == "finished"
+        failed = status == "failed"
         if completed:
             logging.info(f"{path_job} is already completed.")
 
@@ -311,6 +422,27 @@ class ClusterSubmission:
             return True
         return False
 
+    def _filter_jobs_to_submit(
+        self, list_of_jobs: list[str], running_jobs: set[str], queuing_jobs: set[str]
+    ) -> list[tuple[int, str]]:
+        """
+        Filters a list of jobs to keep only the ones that must be (re)submitted.
+
+        Args:
+            list_of_jobs (list[str]): List of jobs to filter.
+            running_jobs (set[str]): The set of currently running jobs.
+            queuing_jobs (set[str]): The set of currently queuing jobs.
+
+        Returns:
+            list[tuple[int, str]]: A list of the jobs to submit, along with their index in the
+                initial list.
+        """
+        return [
+            (idx_job, job)
+            for idx_job, job in enumerate(list_of_jobs)
+            if self._test_job(job, self._return_abs_path_job(job)[0], running_jobs, queuing_jobs)
+        ]
+
     def _return_htc_flavour(self, job: str) -> str:
         """
         Retrieve the HTC flavor for a given job.
@@ -321,12 +453,12 @@ class ClusterSubmission:
         Returns:
             str: The HTC flavor associated with the job.
         """
-        l_keys = self.dic_all_jobs[job]["l_keys"]
-        return nested_get(self.dic_tree, l_keys + ["htc_flavor"])
+        return self.dic_subdic_job[job]["htc_flavor"]
 
     def _return_abs_path_job(self, job: str) -> tuple[str, str]:
         """
-        Generate the relative and absolute paths for a given job.
+        Generate the relative and absolute paths for a given job. The paths are only computed once
+        per job.
 
         Args:
             job (str): The job string containing the path to the job file.
@@ -336,16 +468,30 @@ class ClusterSubmission:
             - path_job (str): The relative path to the job directory.
             - abs_path_job (str): The absolute path to the job directory.
         """
-        # Get corresponding path job (remove the python file name)
-        path_job = "/".join(job.split("/")[:-1]) + "/"
-        abs_path_job = f"{self.abs_path_study}/{path_job}"
-        return path_job, abs_path_job
+        if job not in self._dic_path_job_cache:
+            # Get corresponding path job (remove the python file name)
+            path_job = f"{os.path.dirname(job)}/"
+            abs_path_job = f"{self.abs_path_study}/{path_job}"
+            self._dic_path_job_cache[job] = (path_job, abs_path_job)
+
+        return self._dic_path_job_cache[job]
+
+    def _ensure_dir(self, path_dir: str) -> None:
+        """
+        Create a folder (and its parents) if it does not exist. Each folder is only checked once.
+
+        Args:
+            path_dir (str): The path of the folder.
+        """
+        if path_dir not in self._set_ensured_dirs:
+            os.makedirs(path_dir, exist_ok=True)
+            self._set_ensured_dirs.add(path_dir)
 
     def _write_sub_files_slurm_docker(
         self,
         sub_filename: str,
-        running_jobs: list[str],
-        queuing_jobs: list[str],
+        running_jobs: set[str],
+        queuing_jobs: set[str],
         list_of_jobs: list[str],
     ) -> tuple[list[str], list[str]]:
         """
@@ -357,50 +503,69 @@ class ClusterSubmission:
 
         Args:
             sub_filename (str): The base name for the submission files.
-            running_jobs (list[str]): A list of job identifiers that are currently running.
-            queuing_jobs (list[str]): A list of job identifiers that are currently queuing.
+            running_jobs (set[str]): The set of job identifiers that are currently running.
+            queuing_jobs (set[str]): The set of job identifiers that are currently queuing.
             list_of_jobs (list[str]): A list of job identifiers to process.
 
         Returns:
             tuple[list[str], list[str]]: A tuple containing two lists:
             - A list of filenames for the generated submission files.
             - A list of job identifiers that were updated.
+
+        Raises:
+            ValueError: If the container_image is not defined in the tree.
         """
-        l_filenames = []
+        l_Sub = []
         list_of_jobs_updated = []
-        for idx_job, job in enumerate(list_of_jobs):
-            path_job, abs_path_job = self._return_abs_path_job(job)
-
-            # Test if job is running, queuing or completed
-            if self._test_job(job, path_job, running_jobs, queuing_jobs):
-                filename_sub = f"{sub_filename.split('.sub')[0]}_{idx_job}.sub"
-
-                # Get job GPU request
-                l_keys = self.dic_all_jobs[job]["l_keys"]
-                # Ensure GPU is defined and set it to False if not
-                if "request_gpu" not in nested_get(self.dic_tree, l_keys):
-                    gpu = nested_set(self.dic_tree, l_keys + ["request_gpu"], False)
-                gpu = nested_get(self.dic_tree, l_keys + ["request_gpu"])
-
-                # Write the submission files
-                # ! Careful, I implemented a fix for path due to the temporary home recovery folder
-                logging.info(f'Writing submission file for node "{abs_path_job}"')
-                fix = True
-                Sub = self.dic_submission["slurm_docker"](
-                    filename_sub, abs_path_job, gpu, self.dic_tree["container_image"], fix=fix
-                )
-                # Create folder if it does not exist
-                folder = "/".join(Sub.sub_filename.split("/")[:-1])
-                Path(folder).mkdir(parents=True, exist_ok=True)
-                with open(Sub.sub_filename, "w") as fid:
-                    fid.write(Sub.head + "\n")
-                    fid.write(Sub.body + "\n")
-                    fid.write(Sub.tail + "\n")
-
-                l_filenames.append(Sub.sub_filename)
-                list_of_jobs_updated.append(job)
+
+        # Base name of the submission files, common to all jobs
+        sub_filename_base = sub_filename.split(".sub")[0]
+
+        # Only keep jobs that are not running, queuing or completed
+        for idx_job, job in self._filter_jobs_to_submit(list_of_jobs, running_jobs, queuing_jobs):
+            abs_path_job = self._return_abs_path_job(job)[1]
+            filename_sub = f"{sub_filename_base}_{idx_job}.sub"
+
+            # Get job GPU request, ensuring it is defined and setting it to False if not
+            gpu = self.dic_subdic_job[job].setdefault("request_gpu", False)
+
+            # Write the submission files
+            # ! Careful, I implemented a fix for path due to the temporary home recovery folder
+            logging.info(f'Writing submission file for node "{abs_path_job}"')
+            fix = True
+            Sub = self.dic_submission["slurm_docker"](
+                filename_sub, abs_path_job, gpu, self._get_path_image(), fix=fix
+            )
+            l_Sub.append(Sub)
+            list_of_jobs_updated.append(job)
+
+        # Create the folder of the submission files (the same for all of them) if it does not exist
+        if l_Sub:
+            self._ensure_dir(os.path.dirname(l_Sub[0].sub_filename))
+
+        # Write the submission files in parallel threads
+        with ThreadPoolExecutor() as executor:
+            l_filenames = list(executor.map(self._write_sub_file_slurm_docker, l_Sub))
+
         return l_filenames, list_of_jobs_updated
 
+    @staticmethod
+    def _write_sub_file_slurm_docker(Sub: SlurmDocker) -> str:
+        """
+        Writes the SLURM submission file of a Docker job to disk. The folder of the file must
+        already exist.
+
+        Args:
+            Sub (SlurmDocker): The submission object of the job.
+
+        Returns:
+            str: The filename of the submission file.
+        """
+        with open(Sub.sub_filename, "w") as fid:
+            fid.write(f"{Sub.head}\n{Sub.body}\n{Sub.tail}\n")
+
+        return Sub.sub_filename
+
     def _get_Sub(
         self, job: str, submission_type: str, sub_filename: str, abs_path_job: str, gpu: bool
     ) -> LocalPC | HTC | HTCDocker | Slurm | SlurmDocker:
@@ -423,48 +588,38 @@ class ClusterSubmission:
             ValueError: If the submission type is not valid or if the container_image is not defined
                 in the tree for docker submissions.
         """
-        match submission_type:
-            case "slurm":
-                return self.dic_submission[submission_type](sub_filename, abs_path_job, gpu)
-            case "htc":
-                return self.dic_submission[submission_type](
-                    sub_filename, abs_path_job, gpu, self._return_htc_flavour(job)
+        if submission_type not in self._dic_build_Sub:
+            raise ValueError(f"Error: {submission_type} is not a valid submission mode")
+        return self._dic_build_Sub[submission_type](job, sub_filename, abs_path_job, gpu)
+
+    def _get_path_image(self) -> str:
+        """
+        Gets the path to the container image of the study (for docker submissions), checking that it
+        is defined in the tree. The check is only done once.
+
+        Returns:
+            str: The path to the container image.
+
+        Raises:
+            ValueError: If the container_image is not defined in the tree.
+        """
+        if self.path_image is None:
+            # Path to singularity image
+            if "container_image" in self.dic_tree and self.dic_tree["container_image"] is not None:
+                self.path_image = self.dic_tree["container_image"]
+            else:
+                raise ValueError(
+                    "Error: container_image is not defined in the tree. Please define it in the"
+                    " config.yaml file."
                 )
-            case w if w in ["htc_docker", "slurm_docker"]:
-                # Path to singularity image
-                if (
-                    "container_image" in self.dic_tree
-                    and self.dic_tree["container_image"] is not None
-                ):
-                    self.path_image = self.dic_tree["container_image"]
-                else:
-                    raise ValueError(
-                        "Error: container_image is not defined in the tree. Please define it in the"
-                        " config.yaml file."
-                    )
 
-                if submission_type == "htc_docker":
-                    return self.dic_submission[submission_type](
-                        sub_filename,
-                        abs_path_job,
-                        gpu,
-                        self.path_image,
-                        self._return_htc_flavour(job),
-                    )
-                else:
-                    return self.dic_submission[submission_type](
-                        sub_filename, abs_path_job, gpu, self.path_image
-                    )
-            case "local":
-                return self.dic_submission[submission_type](sub_filename, abs_path_job)
-            case _:
-                raise ValueError(f"Error: {submission_type} is not a valid submission mode")
+        return self.path_image
 
     def _write_sub_file(
         self,
         sub_filename: str,
-        running_jobs: list[str],
-        queuing_jobs: list[str],
+        running_jobs: set[str],
+        queuing_jobs: set[str],
         list_of_jobs: list[str],
         submission_type: str,
     ) -> tuple[list[str], list[str]]:
@@ -473,8 +628,8 @@ class ClusterSubmission:
 
         Args:
             sub_filename (str): The filename for the submission file.
-            running_jobs (list[str]): List of currently running jobs.
-            queuing_jobs (list[str]): List of currently queuing jobs.
+            running_jobs (set[str]): Set of currently running jobs.
+            queuing_jobs (set[str]): Set of currently queuing jobs.
             list_of_jobs (list[str]): List of jobs to be submitted.
             submission_type (str): The type of submission.
 
@@ -483,65 +638,55 @@ class ClusterSubmission:
             - A list with the submission filename if the file was created, otherwise an empty list.
             - An updated list of jobs that were included in the submission file.
         """
-        # Flag to know if the file can be submitted (at least one job in it)
-        ok_to_submit = False
-
-        # Flat to know if the header has been written
-        header_written = False
-
-        # Create folder to the submission file if it does not exist
-        os.makedirs("/".join(sub_filename.split("/")[:-1]), exist_ok=True)
-
         # Updated list of jobs (without unsubmitted jobs)
         list_of_jobs_updated = []
 
-        # Write the submission file
+        # Build the content of the submission file
+        l_lines = []
         Sub = None
-        with open(sub_filename, "w") as fid:
-            for job in list_of_jobs:
-                # Get corresponding path job (remove the python file name)
-                path_job, abs_path_job = self._return_abs_path_job(job)
+        # Only keep jobs that are not running, queuing or completed
+        for _, job in self._filter_jobs_to_submit(list_of_jobs, running_jobs, queuing_jobs):
+            # Get corresponding absolute path job (remove the python file name)
+            abs_path_job = self._return_abs_path_job(job)[1]
+            logging.info(f'Writing submission command for node "{abs_path_job}"')
 
-                # Test if job is running, queuing or completed
-                if self._test_job(job, path_job, running_jobs, queuing_jobs):
-                    logging.info(f'Writing submission command for node "{abs_path_job}"')
+            # Get job GPU request, ensuring it is defined and setting it to False if not
+            gpu = self.dic_subdic_job[job].setdefault("request_gpu", False)
 
-                    # Get job GPU request
-                    l_keys = self.dic_all_jobs[job]["l_keys"]
-                    # Ensure GPU is defined, and set it to False if not
-                    if "request_gpu" not in nested_get(self.dic_tree, l_keys):
-                        gpu = nested_set(self.dic_tree, l_keys + ["request_gpu"], False)
-                    gpu = nested_get(self.dic_tree, l_keys + ["request_gpu"])
+            # Get Submission object
+            Sub = self._get_Sub(job, submission_type, sub_filename, abs_path_job, gpu)
 
-                    # Get Submission object
-                    Sub = self._get_Sub(job, submission_type, sub_filename, abs_path_job, gpu)
+            # Take the first job as reference for head
+            if not l_lines:
+                l_lines.append(Sub.head + "\n")
 
-                    # Take the first job as reference for head
-                    if not header_written:
-                        fid.write(Sub.head + "\n")
-                        header_written = True
+            # Write instruction for submission
+            l_lines.append(Sub.body + "\n")
 
-                    # Write instruction for submission
-                    fid.write(Sub.body + "\n")
+            # Append job to list_of_jobs_updated
+            list_of_jobs_updated.append(job)
 
-                    # Append job to list_of_jobs_updated
-                    list_of_jobs_updated.append(job)
+        # Nothing to submit (at least one job is needed in the file), remove any outdated file
+        if Sub is None:
+            if os.path.exists(sub_filename):
+                os.remove(sub_filename)
+            return [], []
 
-            # Tail instruction
-            if Sub is not None:
-                fid.write(Sub.tail + "\n")
-                ok_to_submit = True
+        # Tail instruction
+        l_lines.append(Sub.tail + "\n")
 
-        if not ok_to_submit:
-            os.remove(sub_filename)
+        # Create folder to the submission file if it does not exist, and write the file at once
+        self._ensure_dir(os.path.dirname(sub_filename))
+        with open(sub_filename, "w") as fid:
+            fid.writelines(l_lines)
 
-        return ([sub_filename], list_of_jobs_updated) if ok_to_submit else ([], [])
+        return [sub_filename], list_of_jobs_updated
 
     def _write_sub_files(
         self,
         sub_filename: str,
-        running_jobs: list[str],
-        queuing_jobs: list[str],
+        running_jobs: set[str],
+        queuing_jobs: set[str],
         list_of_jobs: list[str],
         submission_type: str,
     ) -> tuple[list[str], list[str]]:
@@ -550,8 +695,8 @@ class ClusterSubmission:
 
         Args:
             sub_filename (str): The name of the submission file to be created.
-            running_jobs (list[str]): A list of currently running jobs.
-            queuing_jobs (list[str]): A list of jobs that are queued.
+            running_jobs (set[str]): The set of currently running jobs.
+            queuing_jobs (set[str]): The set of jobs that are queued.
             list_of_jobs (list[str]): A list of all jobs to be submitted.
             submission_type (str): The type of submission system being used (e.g., "slurm_docker").
 
@@ -591,22 +736,18 @@ class ClusterSubmission:
         """
         running_jobs, queuing_jobs = self._get_state_jobs(verbose=False)
 
-        # Make a dict of all jobs to submit depending on the submission type
-        dic_jobs_to_submit = {key: [] for key in self.dic_submission.keys()}
-        for job in self.l_jobs_to_submit:
-            l_keys = self.dic_all_jobs[job]["l_keys"]
-            submission_type = nested_get(self.dic_tree, l_keys + ["submission_type"])
-            dic_jobs_to_submit[submission_type].append(job)  # type: ignore
+        # Convert to sets, as membership is tested for every job
+        set_running_jobs, set_queuing_jobs = set(running_jobs), set(queuing_jobs)
 
         # Write submission files for each submission type
         dic_submission_files = {}
-        for submission_type, list_of_jobs in dic_jobs_to_submit.items():
+        for submission_type, list_of_jobs in self.dic_jobs_to_submit.items():
             if len(list_of_jobs) > 0:
                 # Write submission files
                 l_submission_filenames, list_of_jobs_updated = self._write_sub_files(
                     self.path_submission_file,
-                    running_jobs,
-                    queuing_jobs,
+                    set_running_jobs,
+                    set_queuing_jobs,
                     copy.copy(list_of_jobs),
                     submission_type,
                 )
@@ -662,28 +803,48 @@ class ClusterSubmission:
             capture_output=True,
         )
 
-        output = process.stdout.decode("utf-8")
-        output_error = process.stderr.decode("utf-8")
-        if "ERROR" in output_error:
-            raise RuntimeError(f"Error in submission: {output_error}")
-        for line in output.split("\n"):
-            if "htc" in submission_type:
-                if "cluster" in line:
-                    cluster_id = int(line.split("cluster ")[1][:-1])
-                    dic_id_to_path_job_temp[cluster_id] = self._return_abs_path_job(
-                        list_of_jobs[idx_submission]
-                    )[0]
-                    idx_submission += 1
-            elif "slurm" in submission_type:
-                if "Submitted" in line:
-                    job_id = int(line.split(" ")[3])
-                    dic_id_to_path_job_temp[job_id] = self._return_abs_path_job(
-                        list_of_jobs[idx_submission]
-                    )[0]
-                    idx_submission += 1
+        if b"ERROR" in process.stderr:
+            raise RuntimeError(f"Error in submission: {process.stderr.decode('utf-8')}")
+
+        # Get the job ids directly from the raw output
+        if "htc" in submission_type:
+            re_job_id = RE_JOB_ID_HTC
+        elif "slurm" in submission_type:
+            re_job_id = RE_JOB_ID_SLURM
+        else:
+            return dic_id_to_path_job_temp, idx_submission
+
+        for match in re_job_id.finditer(process.stdout):
+            job_id = int(match.group(1))
+            dic_id_to_path_job_temp[job_id] = self._return_abs_path_job(
+                list_of_jobs[idx_submission]
+            )[0]
+            idx_submission += 1
 
         return dic_id_to_path_job_temp, idx_submission
 
+    def _write_launcher_slurm_docker(self, l_submission_filenames: list[str]) -> str:
+        """
+        Writes a script submitting all the Slurm Docker submission files (one per job) at once.
+
+        Args:
+            l_submission_filenames (list[str]): List of Slurm Docker submission filenames.
+
+        Returns:
+            str: The path to the script.
+        """
+        path_launcher = f"{self.path_submission_file.split('.sub')[0]}_slurm_docker.sh"
+        self._ensure_dir(os.path.dirname(path_launcher))
+        with open(path_launcher, "w") as fid:
+            # Stop at the first failed submission, such that the ids stay aligned with the jobs
+            fid.write("# Running on SLURM Docker\nset -e\n")
+            fid.writelines(
+                f"{SlurmDocker.get_submit_command(sub_filename)}\n"
+                for sub_filename in l_submission_filenames
+            )
+
+        return path_launcher
+
     def submit(
         self, list_of_jobs: list[str], l_submission_filenames: list[str], submission_type: str
     ) -> None:
@@ -700,6 +861,7 @@ class ClusterSubmission:
             ValueError: If multiple submission files are provided for a non-"slurm_docker"
                 submission type.
             ValueError: If the submission type is not valid.
+            RuntimeError: If the number of Slurm job ids returned doesn't match the number of jobs.
 
         Returns:
             None
@@ -715,14 +877,28 @@ class ClusterSubmission:
         if not l_submission_filenames:
             logging.info("No job being submitted.")
 
+        # Slurm docker requires one submission file per job: gather them in a single script (as for
+        # Slurm), such that all jobs are submitted with one call instead of one call per job
+        submission_type_command = submission_type
+        if submission_type == "slurm_docker" and len(l_submission_filenames) > 1:
+            l_submission_filenames = [self._write_launcher_slurm_docker(l_submission_filenames)]
+            submission_type_command = "slurm"
+
         # Submit
         dic_id_to_path_job_temp = {}
         idx_submission = 0
         for sub_filename in l_submission_filenames:
             if submission_type == "local":
-                os.system(self.dic_submission[submission_type].get_submit_command(sub_filename))
+                # Run the submission script directly (no intermediate shell), it returns as soon as
+                # the jobs are launched in the background
+                subprocess.run(
+                    shlex.split(
+                        self.dic_submission[submission_type].get_submit_command(sub_filename)
+                    ),
+                    close_fds=True,
+                )
             elif submission_type in {"htc", "slurm", "htc_docker", "slurm_docker"}:
-                submit_command = self.dic_submission[submission_type].get_submit_command(
+                submit_command = self.dic_submission[submission_type_command].get_submit_command(
                     sub_filename
                 )
                 dic_id_to_path_job_temp, idx_submission = self._update_job_status_from_hpc_output(
@@ -735,6 +911,13 @@ class ClusterSubmission:
             else:
                 raise ValueError(f"Error: {submission_type} is not a valid submission mode")
 
+        # Slurm returns one id per job: if a submission failed, the ids can't be matched to the jobs
+        if "slurm" in submission_type and len(dic_id_to_path_job_temp) != len(list_of_jobs):
+            raise RuntimeError(
+                f"Error in submission: {len(dic_id_to_path_job_temp)} job ids were returned for"
+                f" {len(list_of_jobs)} submitted jobs"
+            )
+
         # Update and write the id-job file
         if dic_id_to_path_job_temp:
             assert len(dic_id_to_path_job_temp) == len(list_of_jobs)
@@ -770,19 +953,15 @@ class ClusterSubmission:
 
         l_path_jobs = []
         # Warning, does not work at the moment in lxplus...
-        for ps in psutil.pids():
-            try:
-                aux = psutil.Process(ps).cmdline()
-            except Exception:
-                aux = []
+        for aux in self._get_processes_cmdline():
             if len(aux) > 1 and "run.sh" in aux[-1]:
                 job = str(Path(aux[-1]).parent)
 
-                # Only get path after name of the study
-                try:
-                    job = job.split(self.study_name)[1]
-                    l_path_jobs.append(f"{self.study_name}{job}/")
-                except IndexError:
+                # Only get path from the name of the study
+                idx_study = job.find(self.study_name)
+                if idx_study >= 0:
+                    l_path_jobs.append(f"{job[idx_study:]}/")
+                else:
                     logging.warning(
                         "Some jobs from another study are running. Acquiring the full path as the "
                         "study name is unknown."
@@ -790,84 +969,197 @@ class ClusterSubmission:
                     l_path_jobs.append(job)
         return l_path_jobs
 
-    def _get_condor_jobs(self, status: str, force_query_individually: bool = False) -> list[str]:
+    @staticmethod
+    def _get_processes_cmdline() -> list[list[str]]:
         """
-        Retrieve the paths of Condor jobs based on their status.
+        Retrieves the command lines of the current processes that may run a job (i.e. that contain
+        'run.sh'). On Linux, /proc is scanned directly, which avoids building a psutil Process
+        object for every process. Otherwise, psutil is used.
+
+        Returns:
+            list[list[str]]: The command lines (as lists of arguments) of the processes.
+        """
+        if not os.path.isdir("/proc"):
+            ll_cmdline = []
+            for ps in psutil.pids():
+                try:
+                    ll_cmdline.append(psutil.Process(ps).cmdline())
+                except Exception:
+                    continue
+            return ll_cmdline
+
+        ll_cmdline = []
+        with os.scandir("/proc") as it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as fid:
+                        cmdline = fid.read()
+                except OSError:
+                    # Process is gone or not accessible
+                    continue
+
+                # Arguments are separated (and terminated) by null bytes
+                if b"run.sh" in cmdline:
+                    ll_cmdline.append(cmdline.rstrip(b"\0").decode(errors="replace").split("\0"))
+
+        return ll_cmdline
+
+    def _get_condor_jobs(
+        self, force_query_individually: bool = False
+    ) -> tuple[list[str], list[str]]:
+        """
+        Retrieve the paths of the running and queuing Condor jobs, with a single query.
 
         Args:
-            status (str): The status of the jobs to retrieve. Can be "running" or "queuing".
             force_query_individually (bool, optional): If True, query each job individually if the
                 id-job file is missing. Defaults to False.
 
         Returns:
-            list[str]: A list of paths to the jobs that match the specified status.
-
-        Raises:
-            ValueError: If the status provided is not "running" or "queuing".
+            tuple[list[str], list[str]]: A tuple containing two lists:
+                - The paths to the running jobs.
+                - The paths to the queuing jobs.
 
         Notes:
-            - The method relies on the `condor_q` command to retrieve job information.
+            - The method relies on the HTCondor Python bindings (if installed) or the `condor_q`
+                command to retrieve job information.
             - If the id-job file is missing and `force_query_individually` is False, jobs not in
                 `dic_id_to_path_job` will be ignored.
-            - If `force_query_individually` is True, the method will query each job individually to
-                retrieve its path.
+            - If `force_query_individually` is True, the method will query the command of the jobs
+                (all at once) to retrieve their path.
             - Warnings are printed if jobs are found that are not in the id-job file or if the
                 id-job file is missing.
         """
-        l_path_jobs = []
-        dic_status = {"running": 1, "queuing": 2}
-        condor_output = subprocess.run(["condor_q"], capture_output=True).stdout.decode("utf-8")
+        dic_path_jobs = {"running": [], "queuing": []}
+        dic_id_to_path_job = self.dic_id_to_path_job
+        set_id_to_find = set(dic_id_to_path_job) if dic_id_to_path_job is not None else set()
 
-        # Check which jobs are running
+        # Check which jobs are running or queuing
         first_line = True
         first_missing_job = True
-        for line in condor_output.split("\n")[4:]:
-            if line == "":
+        l_jobs_to_query = []
+        jobid_found = None
+        for jobid, status in self._get_condor_jobs_status():
+            # No need to look further once all the jobs of the study have been found (the statuses
+            # of a given cluster are listed consecutively, and must all be kept)
+            if dic_id_to_path_job is not None and not set_id_to_find and jobid != jobid_found:
                 break
-            jobid = int(line.split("ID:")[1][1:8])
-            condor_status = line.split("      ")[1:5]  # Done, Run, Idle, and potentially Hold
-
-            # If job is running/queuing, get the path to the job
-            if condor_status[dic_status[status]] == "1":
-                # Get path from dic_id_to_path_job if available
-                if self.dic_id_to_path_job is not None:
-                    if jobid in self.dic_id_to_path_job:
-                        l_path_jobs.append(self.dic_id_to_path_job[jobid])
-                    elif first_missing_job:
-                        logging.warning(
-                            "Warning, some jobs are queuing/running and are not in the id-job"
-                            " file. They may come from another study. Ignoring them."
-                        )
-                        first_missing_job = False
-
-                elif force_query_individually:
-                    if first_line:
-                        logging.warning(
-                            "Warning, some jobs are queuing/running and the id-job file is"
-                            " missing... Querying them individually."
-                        )
-                        first_line = False
-                    job_details = subprocess.run(
-                        ["condor_q", "-l", f"{jobid}"], capture_output=True
-                    ).stdout.decode("utf-8")
-                    job = job_details.split('Cmd = "')[1].split("run.sh")[0]
-
-                    # Only get path after master_study
-                    job = job.split(self.study_name)[1]
-                    l_path_jobs.append(f"{self.study_name}{job}")
-
-                elif first_line:
+
+            # Get path from dic_id_to_path_job if available
+            if dic_id_to_path_job is not None:
+                path_job = dic_id_to_path_job.get(jobid)
+                if path_job is not None:
+                    dic_path_jobs[status].append(path_job)
+                    set_id_to_find.discard(jobid)
+                    jobid_found = jobid
+                elif first_missing_job:
+                    logging.warning(
+                        "Warning, some jobs are queuing/running and are not in the id-job"
+                        " file. They may come from another study. Ignoring them."
+                    )
+                    first_missing_job = False
+
+            elif force_query_individually:
+                if first_line:
                     logging.warning(
                         "Warning, some jobs are queuing/running and the id-job file is"
-                        " missing... Ignoring them."
+                        " missing... Querying them individually."
                     )
                     first_line = False
+                l_jobs_to_query.append((status, jobid))
 
-        return l_path_jobs
+            elif first_line:
+                logging.warning(
+                    "Warning, some jobs are queuing/running and the id-job file is"
+                    " missing... Ignoring them."
+                )
+                first_line = False
+
+        # Get the path of the jobs to query individually, with a single query for all of them
+        if l_jobs_to_query:
+            dic_id_to_path_job_condor = self._get_condor_jobs_path()
+            for status, jobid in l_jobs_to_query:
+                if jobid in dic_id_to_path_job_condor:
+                    dic_path_jobs[status].append(dic_id_to_path_job_condor[jobid])
+
+        return dic_path_jobs["running"], dic_path_jobs["queuing"]
+
+    def _get_condor_jobs_status(self) -> list[tuple[int, str]]:
+        """
+        Queries Condor for the status of the jobs of the user. The HTCondor Python bindings are used
+        if they are installed, as they return structured job ads without going through the
+        condor_q command line. Otherwise, the autoformatted output of condor_q is parsed.
+
+        Returns:
+            list[tuple[int, str]]: A list of (job id, status) pairs, the status being "running" or
+                "queuing". A cluster with both running and queuing jobs has one pair per status,
+                listed consecutively.
+        """
+        try:
+            import htcondor
+        except ImportError:
+            htcondor = None
+
+        if htcondor is not None:
+            l_ads = htcondor.Schedd().query(
+                constraint=f'Owner == "{getpass.getuser()}" && (JobStatus == 1 || JobStatus == 2)',
+                projection=["ClusterId", "JobStatus"],
+            )
+            l_id_status = [(int(ad["ClusterId"]), int(ad["JobStatus"])) for ad in l_ads]
 
-    def _get_slurm_jobs(self, status: str, force_query_individually: bool = False) -> list[str]:
+        # Otherwise, parse the (autoformatted) output of condor_q, one job per line
+        else:
+            condor_output = subprocess.run(
+                ["condor_q", "-af", "ClusterId", "JobStatus"], capture_output=True, encoding="utf-8"
+            ).stdout
+            l_id_status = []
+            for line in condor_output.splitlines():
+                l_split = line.split()
+                if len(l_split) == 2 and l_split[0].isdigit() and l_split[1].isdigit():
+                    l_id_status.append((int(l_split[0]), int(l_split[1])))
+
+        # Several jobs of a same cluster share the same id, keep each of their statuses once
+        dic_id_to_statuses: dict[int, dict[str, None]] = {}
+        for jobid, job_status in l_id_status:
+            if job_status in DIC_CONDOR_JOB_STATUS:
+                dic_id_to_statuses.setdefault(jobid, {})[DIC_CONDOR_JOB_STATUS[job_status]] = None
+        return [
+            (jobid, status)
+            for jobid, dic_statuses in dic_id_to_statuses.items()
+            for status in dic_statuses
+        ]
+
+    def _get_condor_jobs_path(self) -> dict[int, str]:
+        """
+        Queries Condor once for the command of all the jobs, to retrieve their path.
+
+        Returns:
+            dict[int, str]: A dictionary mapping the ids of the jobs of the study to their path,
+                starting from the study name.
         """
-        Retrieve a list of SLURM job paths based on their status.
+        condor_output = subprocess.run(
+            ["condor_q", "-af", "ClusterId", "Cmd"], capture_output=True, encoding="utf-8"
+        ).stdout
+
+        # Each line contains the id and the command of a job
+        dic_id_to_path_job = {}
+        for line in condor_output.splitlines():
+            l_split = line.split(maxsplit=1)
+            if len(l_split) < 2 or self.study_name not in l_split[1]:
+                continue
+            job = l_split[1].split("run.sh")[0]
+
+            # Only get path from master_study
+            dic_id_to_path_job[int(l_split[0])] = job[job.find(self.study_name) :]
+
+        return dic_id_to_path_job
+
+    def _get_slurm_jobs(
+        self, force_query_individually: bool = False
+    ) -> tuple[list[str], list[str]]:
+        """
+        Retrieve the paths of the running and queuing SLURM jobs, with a single query.
 
         This method queries SLURM to get the job IDs and their statuses for the current user.
         It then attempts to map these job IDs to their corresponding paths using an internal
@@ -875,37 +1167,48 @@ class ClusterSubmission:
         optionally query each job individually for its details.
 
         Args:
-            status (str): The status of the jobs to retrieve. Expected values are "running" or
-                "queuing".
             force_query_individually (bool, optional): If True, query each job individually for its
                 details when the job ID is not found in the internal dictionary. Defaults to False.
 
         Returns:
-            list[str]: A list of job paths corresponding to the specified status.
+            tuple[list[str], list[str]]: A tuple containing two lists:
+                - The paths to the running jobs.
+                - The paths to the queuing jobs.
         """
-        l_path_jobs = []
-        dic_status = {"running": "RUNNING", "queuing": "PENDING"}
-        username = (
-            subprocess.run(["id", "-u", "-n"], capture_output=True).stdout.decode("utf-8").strip()
-        )
+        dic_path_jobs = {"running": [], "queuing": []}
+        username = getpass.getuser()
         slurm_output = subprocess.run(
-            ["squeue", "-u", f"{username}", "-t", dic_status[status]], capture_output=True
-        ).stdout.decode("utf-8")
+            ["squeue", "-u", f"{username}", "-t", "RUNNING,PENDING", "-h", "-o", "%i %t"],
+            capture_output=True,
+            encoding="utf-8",
+        ).stdout
+        dic_id_to_path_job = self.dic_id_to_path_job
+        set_id_to_find = set(dic_id_to_path_job) if dic_id_to_path_job is not None else set()
 
         # Get job id and details
         first_line = True
         first_missing_job = True
-        for line in slurm_output.split("\n")[1:]:
+        l_jobs_to_query = []
+        for line in slurm_output.splitlines():
+            # Each line contains the id and the (compact) state of a job
             l_split = line.split()
-            if len(l_split) == 0:
-                break
+            if len(l_split) != 2 or not l_split[0].isdigit():
+                continue
             jobid = int(l_split[0])
-            slurm_status = l_split[4]  # R or PD  # noqa: F841
+            status = DIC_SLURM_JOB_STATUS.get(l_split[1])  # R or PD
+            if status is None:
+                continue
 
             # Get path from dic_id_to_path_job if available
-            if self.dic_id_to_path_job is not None:
-                if jobid in self.dic_id_to_path_job:
-                    l_path_jobs.append(self.dic_id_to_path_job[jobid])
+            if dic_id_to_path_job is not None:
+                path_job = dic_id_to_path_job.get(jobid)
+                if path_job is not None:
+                    dic_path_jobs[status].append(path_job)
+
+                    # No need to look further once all the jobs of the study have been found
+                    set_id_to_find.discard(jobid)
+                    if not set_id_to_find:
+                        break
                 elif first_missing_job:
                     logging.warning(
                         "Warning, some jobs are queuing/running and are not in the id-job"
@@ -920,17 +1223,7 @@ class ClusterSubmission:
                         " missing... Querying them individually."
                     )
                     first_line = False
-                job_details = subprocess.run(
-                    ["scontrol", "show", "jobid", "-dd", f"{jobid}"], capture_output=True
-                ).stdout.decode("utf-8")
-                job = (
-                    job_details.split("Command=")[1].split("run.sh")[0]
-                    if "run.sh" in job_details
-                    else job_details.split("StdOut=")[1].split("output.txt")[0]
-                )
-                # Only get path after study_name
-                job = job.split(self.study_name)[1]
-                l_path_jobs.append(f"{self.study_name}{job}")
+                l_jobs_to_query.append((status, jobid))
 
             elif first_line:
                 logging.warning(
@@ -939,7 +1232,123 @@ class ClusterSubmission:
                 )
                 first_line = False
 
-        return l_path_jobs
+        if l_jobs_to_query:
+            # Get the path of the jobs from their command, with a single query for all of them
+            dic_id_to_path_job_slurm = self._get_slurm_jobs_path(username)
+
+            # Query the remaining jobs (not run from a run.sh script) individually, concurrently (but
+            # with a limited number of simultaneous queries, not to overload the scheduler)
+            l_jobid_missing = [
+                jobid for _, jobid in l_jobs_to_query if jobid not in dic_id_to_path_job_slurm
+            ]
+            if l_jobid_missing:
+                with ThreadPoolExecutor(max_workers=MAX_SIMULTANEOUS_QUERIES) as executor:
+                    l_paths = executor.map(self._get_slurm_job_path, l_jobid_missing)
+                    dic_id_to_path_job_slurm.update(zip(l_jobid_missing, l_paths))
+
+            for status, jobid in l_jobs_to_query:
+                # Jobs from other studies have no path
+                if dic_id_to_path_job_slurm[jobid] is not None:
+                    dic_path_jobs[status].append(dic_id_to_path_job_slurm[jobid])
+
+        return dic_path_jobs["running"], dic_path_jobs["queuing"]
+
+    def _get_slurm_jobs_path(self, username: str) -> dict[int, str | None]:
+        """
+        Queries SLURM once for the command of all the running and queuing jobs of the user, to
+        retrieve their path.
+
+        Args:
+            username (str): The name of the user.
+
+        Returns:
+            dict[int, str | None]: A dictionary mapping the ids of the jobs run from a run.sh script
+                to their path, starting from the study name (None for jobs from another study).
+        """
+        slurm_output = subprocess.run(
+            ["squeue", "-u", f"{username}", "-t", "RUNNING,PENDING", "-h", "-o", "%i|%o"],
+            capture_output=True,
+            encoding="utf-8",
+        ).stdout
+
+        # Each line contains the id and the command of a job
+        dic_id_to_path_job = {}
+        for line in slurm_output.splitlines():
+            jobid, _, command = line.partition("|")
+            if not jobid.isdigit() or "run.sh" not in command:
+                continue
+            if self.study_name not in command:
+                dic_id_to_path_job[int(jobid)] = None
+                continue
+
+            # Only get path from study_name
+            job = command.split("run.sh")[0]
+            dic_id_to_path_job[int(jobid)] = job[job.find(self.study_name) :]
+
+        return dic_id_to_path_job
+
+    def _get_slurm_job_path(self, jobid: int) -> str | None:
+        """
+        Queries SLURM for the details of a single job, to retrieve its path.
+
+        Args:
+            jobid (int): The id of the job.
+
+        Returns:
+            str | None: The path of the job, starting from the study name (None for jobs from
+                another study, or if the job details could not be retrieved).
+        """
+        job_details = subprocess.run(
+            ["scontrol", "show", "jobid", "-dd", f"{jobid}"], capture_output=True, encoding="utf-8"
+        ).stdout
+        # The job folder is the one of the run.sh script, or otherwise the one of the output file
+        match = RE_SLURM_JOB_FOLDER.search(job_details)
+        if match is None:
+            # E.g. the job ended between the two queries
+            logging.warning(f"Could not retrieve the path of job {jobid} from its details.")
+            return None
+        job = match.group("command") or match.group("stdout")
+        # Only get path from study_name (jobs from other studies have no path)
+        idx_study = job.find(self.study_name)
+        return job[idx_study:] if idx_study >= 0 else None
+
+    def querying_all_jobs(
+        self, check_local: bool, check_htc: bool, check_slurm: bool
+    ) -> tuple[list[str], list[str]]:
+        """
+        Queries the running and queuing jobs from different job management systems based on the
+        provided flags. Each job management system is queried only once for both statuses, and the
+        systems are queried concurrently.
+
+        Args:
+            check_local (bool): If True, check for local jobs.
+            check_htc (bool): If True, check for HTC (High Throughput Computing) jobs.
+            check_slurm (bool): If True, check for SLURM jobs.
+
+        Returns:
+            tuple[list[str], list[str]]: A tuple containing two lists:
+                - The paths to the running jobs.
+                - The paths to the queuing jobs.
+        """
+        # Query the systems concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future_local = executor.submit(self._get_local_jobs) if check_local else None
+            future_htc = executor.submit(self._get_condor_jobs) if check_htc else None
+            future_slurm = executor.submit(self._get_slurm_jobs) if check_slurm else None
+
+        running_jobs = []
+        queuing_jobs = []
+        if future_local is not None:
+            # There is no queuing in local pc
+            running_jobs.extend(future_local.result())
+
+        for future in (future_htc, future_slurm):
+            if future is not None:
+                running_jobs_cluster, queuing_jobs_cluster = future.result()
+                running_jobs.extend(running_jobs_cluster)
+                queuing_jobs.extend(queuing_jobs_cluster)
+
+        return running_jobs, queuing_jobs
 
     def querying_jobs(
         self, check_local: bool, check_htc: bool, check_slurm: bool, status: str = "running"
@@ -956,19 +1365,5 @@ class ClusterSubmission:
         Returns:
             list[str]: A list of job paths that match the query criteria.
         """
-        # sourcery skip: remove-redundant-if, remove-redundant-pass, swap-nested-ifs
-        l_path_jobs = []
-        if check_local:
-            if status == "running":
-                l_path_jobs.extend(self._get_local_jobs())
-            else:
-                # Always empty return as there is no queuing in local pc
-                pass
-
-        if check_htc:
-            l_path_jobs.extend(self._get_condor_jobs(status))
-
-        if check_slurm:
-            l_path_jobs.extend(self._get_slurm_jobs(status))
-
-        return l_path_jobs
+        running_jobs, queuing_jobs = self.querying_all_jobs(check_local, check_htc, check_slurm)
+        return running_jobs if status == "running" else queuing_jobs
@@ -4,6 +4,7 @@ systems."""
 # --- Imports
 # ==================================================================================================
 # Standard library imports
+from functools import lru_cache
 
 
 # ==================================================================================================
@@ -31,7 +32,7 @@ class SubmissionStatement:
 
         Args:
             sub_filename (str): The name of the submission file.
-            path_job_folder (str): The path to the job folder. Trailing slash will be removed if
+            path_job_folder (str): The path to the job folder. Trailing slashes will be removed if
                 present.
             gpu (bool | None): If a GPU must be requested.
 
@@ -43,9 +44,7 @@ class SubmissionStatement:
                 set to '#SBATCH --partition=slurm_hpc_acc'.
         """
         self.sub_filename: str = sub_filename
-        self.path_job_folder: str = (
-            path_job_folder[:-1] if path_job_folder[-1] == "/" else path_job_folder
-        )
+        self.path_job_folder: str = path_job_folder.rstrip("/")
 
         # GPU configuration
         if gpu:
@@ -72,6 +71,10 @@ class LocalPC(SubmissionStatement):
         get_submit_command(sub_filename): Returns the command to submit the job.
     """
 
+    # Head and tail are the same for all jobs
+    head: str = "# Running on local pc"
+    tail: str = "# Local pc"
+
     def __init__(self, sub_filename: str, path_job_folder: str, gpu: bool | None = None):
         """
         Initializes the LocalPC submission statement.
@@ -83,9 +86,7 @@ class LocalPC(SubmissionStatement):
         """
         super().__init__(sub_filename, path_job_folder, gpu)
 
-        self.head: str = "# Running on local pc"
         self.body: str = f"bash {self.path_job_folder}/run.sh &"
-        self.tail: str = "# Local pc"
         self.submit_command: str = self.get_submit_command(sub_filename)
 
     @staticmethod
@@ -117,6 +118,10 @@ class Slurm(SubmissionStatement):
         get_submit_command(sub_filename): Returns the command to submit the job.
     """
 
+    # Head and tail are the same for all jobs
+    head: str = "# Running on SLURM "
+    tail: str = "# SLURM"
+
     def __init__(self, sub_filename: str, path_job_folder: str, gpu: bool | None):
         """
         Initializes the SLURM submission statement.
@@ -128,7 +133,6 @@ class Slurm(SubmissionStatement):
         """
         super().__init__(sub_filename, path_job_folder, gpu)
 
-        self.head: str = "# Running on SLURM "
         if self.slurm_queue_statement != "":
             queue_statement = self.slurm_queue_statement.split(" ")[1]
         else:
@@ -138,7 +142,6 @@ class Slurm(SubmissionStatement):
             f"--output=output.txt --error=error.txt "
             f"--gres=gpu:{self.request_GPUs} {self.path_job_folder}/run.sh"
         )
-        self.tail: str = "# SLURM"
         self.submit_command: str = self.get_submit_command(sub_filename)
 
     @staticmethod
@@ -171,6 +174,9 @@ class SlurmDocker(SubmissionStatement):
         get_submit_command(sub_filename): Returns the command to submit the job.
     """
 
+    # Tail is the same for all jobs (the head depends on the job folder)
+    tail: str = "# SLURM Docker"
+
     def __init__(
         self,
         sub_filename: str,
@@ -201,16 +207,14 @@ class SlurmDocker(SubmissionStatement):
 
         self.head: str = (
             "#!/bin/bash\n"
-            + "# This is a SLURM submission file using Docker\n"
-            + self.slurm_queue_statement
-            + "\n"
-            + f"#SBATCH --output={self.path_job_folder}/output.txt\n"
-            + f"#SBATCH --error={self.path_job_folder}/error.txt\n"
-            + "#SBATCH --ntasks=2\n"
-            + f"#SBATCH --gres=gpu:{self.request_GPUs}"
+            "# This is a SLURM submission file using Docker\n"
+            f"{self.slurm_queue_statement}\n"
+            f"#SBATCH --output={self.path_job_folder}/output.txt\n"
+            f"#SBATCH --error={self.path_job_folder}/error.txt\n"
+            "#SBATCH --ntasks=2\n"
+            f"#SBATCH --gres=gpu:{self.request_GPUs}"
         )
         self.body: str = f"singularity exec {path_image} {self.path_job_folder}/run.sh"
-        self.tail: str = "# SLURM Docker"
         self.submit_command: str = self.get_submit_command(sub_filename)
 
     @staticmethod
@@ -243,6 +247,15 @@ class HTC(SubmissionStatement):
         get_submit_command(sub_filename): Returns the command to submit the job.
     """
 
+    # Head and tail are the same for all jobs
+    head: str = (
+        "# This is a HTCondor submission file\n"
+        "error  = error.txt\n"
+        "output = output.txt\n"
+        "log  = log.txt"
+    )
+    tail: str = "# HTC"
+
     def __init__(
         self, sub_filename: str, path_job_folder: str, gpu: bool, htc_flavor: str = "espresso"
     ):
@@ -257,20 +270,13 @@ class HTC(SubmissionStatement):
         """
         super().__init__(sub_filename, path_job_folder, gpu)
 
-        self.head: str = (
-            "# This is a HTCondor submission file\n"
-            + "error  = error.txt\n"
-            + "output = output.txt\n"
-            + "log  = log.txt"
-        )
         self.body: str = (
             f"initialdir = {self.path_job_folder}\n"
-            + f"executable = {self.path_job_folder}/run.sh\n"
-            + f"request_GPUs = {self.request_GPUs}\n"
-            + f'+JobFlavour  = "{htc_flavor}"\n'
-            + "queue"
+            f"executable = {self.path_job_folder}/run.sh\n"
+            f"request_GPUs = {self.request_GPUs}\n"
+            f'+JobFlavour  = "{htc_flavor}"\n'
+            "queue"
         )
-        self.tail: str = "# HTC"
         self.submit_command: str = self.get_submit_command(sub_filename)
 
     @staticmethod
@@ -300,9 +306,13 @@ class HTCDocker(SubmissionStatement):
     Methods:
         __init__(sub_filename, path_job_folder, gpu, path_image, htc_flavor='espresso'):
             Initializes the HTCondor Docker submission statement.
+        get_head(path_image): Returns the header of the submission script for a given image.
         get_submit_command(sub_filename): Returns the command to submit the job.
     """
 
+    # Tail is the same for all jobs
+    tail: str = "# HTC Docker"
+
     def __init__(
         self,
         sub_filename: str,
@@ -323,25 +333,39 @@ class HTCDocker(SubmissionStatement):
         """
         super().__init__(sub_filename, path_job_folder, gpu)
 
-        self.head: str = (
-            "# This is a HTCondor submission file using Docker\n"
-            + "error  = error.txt\n"
-            + "output = output.txt\n"
-            + "log  = log.txt\n"
-            + "universe = vanilla\n"
-            + "+SingularityImage ="
-            + f' "{path_image}"'
-        )
+        self.head: str = self.get_head(path_image)
         self.body: str = (
             f"initialdir = {self.path_job_folder}\n"
-            + f"executable = {self.path_job_folder}/run.sh\n"
-            + f"request_GPUs = {self.request_GPUs}\n"
-            + f'+JobFlavour  = "{htc_flavor}"\n'
-            + "queue"
+            f"executable = {self.path_job_folder}/run.sh\n"
+            f"request_GPUs = {self.request_GPUs}\n"
+            f'+JobFlavour  = "{htc_flavor}"\n'
+            "queue"
         )
-        self.tail: str = "# HTC Docker"
         self.submit_command: str = self.get_submit_command(sub_filename)
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_head(path_image: str) -> str:
+        """
+        Returns the header of the submission script. It only depends on the image, and is therefore
+        only built once per image.
+
+        Args:
+            path_image (str): The path to the Docker image.
+
+        Returns:
+            str: The header of the submission script.
+        """
+        return (
+            "# This is a HTCondor submission file using Docker\n"
+            "error  = error.txt\n"
+            "output = output.txt\n"
+            "log  = log.txt\n"
+            "universe = vanilla\n"
+            "+SingularityImage ="
+            f' "{path_image}"'
+        )
+
     @staticmethod
     def get_submit_command(sub_filename: str) -> str:
         """
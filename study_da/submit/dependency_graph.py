@@ -86,7 +86,7 @@ class DependencyGraph:
         return [
             dep
             for dep, l_keys in zip(l_dependencies, ll_keys)
-            if nested_get(self.dic_tree, l_keys + ["status"]) not in ["finished", "failed"]
+            if nested_get(self.dic_tree, l_keys)["status"] not in ["finished", "failed"]
         ]
 
     def get_failed_dependency(self, job: str) -> list:
@@ -112,5 +112,5 @@ class DependencyGraph:
         return [
             dep
             for dep, l_keys in zip(l_dependencies, ll_keys)
-            if nested_get(self.dic_tree, l_keys + ["status"]) == "failed"
+            if nested_get(self.dic_tree, l_keys)["status"] == "failed"
         ]
@@ -33,6 +33,12 @@ import yaml
 # Local imports
 from study_da.utils import find_item_in_dic
 
+# ==================================================================================================
+# --- Constants
+# ==================================================================================================
+# YAML loader, based on libyaml if PyYAML was built with it (much faster than the pure Python one)
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
 
 # ==================================================================================================
 # --- Functions
@@ -189,9 +195,11 @@ def _generate_run_file_htc(
     # Ensure that the name config corresponds to the name and not the path
     name_config = os.path.basename(name_config)
 
-    # Mutate all paths in config to be absolute
-    with open(f"{abs_path}/../{name_config}", "r") as f:
-        config = yaml.load(f, Loader=yaml.FullLoader)
+    # Mutate all paths in config to be absolute (the config is only needed for the dependencies)
+    config = {}
+    if l_dependencies:
+        with open(f"{abs_path}/../{name_config}", "r") as f:
+            config = yaml.load(f, Loader=YAML_LOADER)
 
     # Mutate paths dependencies to be absolute, if they're not already absolute
     dic_to_mutate = {}
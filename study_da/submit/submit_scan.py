@@ -5,9 +5,11 @@ on a cluster."""
 # --- Imports
 # ==================================================================================================
 # Standard library imports
+import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 # Third party imports
@@ -133,24 +135,34 @@ class SubmitScan:
     @property
     def dic_tree(self) -> dict:
         """
-        Loads the dictionary tree from the path.
+        Loads the dictionary tree from the path (YAML, or JSON if the path ends with .json).
 
         Returns:
             dict: The loaded dictionary tree.
         """
         logging.info(f"Loading tree from {self.path_tree}")
-        return load_dic_from_path(self.path_tree)[0]
+        if self.path_tree.endswith(".json"):
+            with open(self.path_tree, "r") as fid:
+                return json.load(fid)
+        return load_dic_from_path(self.path_tree, typ="safe")[0]
 
     # Setter for the dic_tree property
     @dic_tree.setter
     def dic_tree(self, value: dict) -> None:
         """
-        Writes the dictionary tree to the path.
+        Writes the dictionary tree to the path (YAML, or JSON if the path ends with .json).
 
         Args:
             value (dict): The dictionary tree to write.
         """
         logging.info(f"Writing tree to {self.path_tree}")
+        if self.path_tree.endswith(".json"):
+            with open(self.path_tree, "w") as fid:
+                fid.write(json.dumps(value, indent=2))
+                # Force os to write to disk now, to avoid race conditions
+                fid.flush()
+                os.fsync(fid.fileno())
+            return
         write_dic_to_path(value, self.path_tree)
 
     def configure_jobs(
@@ -233,15 +245,17 @@ class SubmitScan:
         """
 
         logging.info("Generating run files for the jobs to submit")
-        # Generate the run files for the jobs to submit
+        # Gather the arguments of the run files for the jobs to submit
         dic_all_jobs = self.get_all_jobs()
+        l_jobs_to_write = []
         for job in l_jobs:
             l_keys = dic_all_jobs[job]["l_keys"]
             job_name = os.path.basename(job)
             relative_job_folder = os.path.dirname(job)
             absolute_job_folder = f"{self.abs_path}/{relative_job_folder}"
             generation_number = dic_all_jobs[job]["gen"]
-            submission_type = nested_get(dic_tree, l_keys + ["submission_type"])
+            dic_job = nested_get(dic_tree, l_keys)
+            submission_type = dic_job["submission_type"]
             singularity = "docker" in submission_type
             path_python_environment = (
                 self.path_python_environment_container
@@ -250,8 +264,8 @@ class SubmitScan:
             )
 
             # Ensure that the run file does not already exist
-            if "path_run" in nested_get(dic_tree, l_keys):
-                path_run_curr = nested_get(dic_tree, l_keys + ["path_run"])
+            if "path_run" in dic_job:
+                path_run_curr = dic_job["path_run"]
                 if path_run_curr is not None and os.path.exists(path_run_curr):
                     logging.info(f"Run file already exists for job {job}. Skipping.")
                     continue
@@ -271,27 +285,49 @@ class SubmitScan:
                 "name_config": name_config,
             } | dic_args
 
-            run_str = generate_run_file(
-                absolute_job_folder,
-                job_name,
-                path_python_environment,
-                htc="htc" in submission_type,
-                additionnal_command=dic_additional_commands_per_gen.get(generation_number, ""),
-                **kwargs_htc,
-            )
-            # Write the run file
-            path_run_job = f"{absolute_job_folder}/run.sh"
-            with open(path_run_job, "w") as f:
-                f.write(run_str)
-
-            # Change permissions to make the file executable
-            os.chmod(path_run_job, 0o755)
-
-            # Record the path to the run file in the tree
+            kwargs_run = {
+                "abs_job_folder": absolute_job_folder,
+                "job_name": job_name,
+                "setup_env_script": path_python_environment,
+                "htc": "htc" in submission_type,
+                "additionnal_command": dic_additional_commands_per_gen.get(generation_number, ""),
+            } | kwargs_htc
+            l_jobs_to_write.append((l_keys, f"{absolute_job_folder}/run.sh", kwargs_run))
+
+        # Generate and write the run files in parallel threads
+        with ThreadPoolExecutor() as executor:
+            l_futures = [
+                executor.submit(self._write_run_file, path_run_job, **kwargs_run)
+                for _, path_run_job, kwargs_run in l_jobs_to_write
+            ]
+            for future in l_futures:
+                future.result()
+
+        # Record the path to the run files in the tree
+        for l_keys, path_run_job, _ in l_jobs_to_write:
             nested_set(dic_tree, l_keys + ["path_run"], path_run_job)
 
         return dic_tree
 
+    @staticmethod
+    def _write_run_file(path_run_job: str, **kwargs_run: Any) -> None:
+        """
+        Generates the run file of a job, writes it and makes it executable.
+
+        Args:
+            path_run_job (str): The path to the run file.
+            **kwargs_run (Any): Keyword arguments for the generate_run_file function.
+
+        Returns:
+            None
+        """
+        run_str = generate_run_file(**kwargs_run)
+        with open(path_run_job, "w") as f:
+            f.write(run_str)
+
+        # Change permissions to make the file executable
+        os.chmod(path_run_job, 0o755)
+
     def check_and_update_all_jobs_status(self) -> tuple[dict[str, Any], str]:
         """
         Checks the status of all jobs and updates their status in the job dictionary.
@@ -316,7 +352,8 @@ class SubmitScan:
             # First pass to update the state of the tree
             for job in dic_all_jobs:
                 # Skip jobs that are already finished, failed or unsubmittable
-                if nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"]) in [
+                dic_job = nested_get(dic_tree, dic_all_jobs[job]["l_keys"])
+                if dic_job["status"] in [
                     "finished",
                     "failed",
                     "unsubmittable",
@@ -327,10 +364,10 @@ class SubmitScan:
                 relative_job_folder = os.path.dirname(job)
                 absolute_job_folder = f"{self.abs_path}/{relative_job_folder}"
                 if os.path.exists(f"{absolute_job_folder}/.finished"):
-                    nested_set(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"], "finished")
+                    dic_job["status"] = "finished"
                 # Check if the job failed otherwise (not to resubmit it again)
                 elif os.path.exists(f"{absolute_job_folder}/.failed"):
-                    nested_set(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"], "failed")
+                    dic_job["status"] = "failed"
                 # else:
                 #     at_least_one_job_to_finish = True
 
@@ -339,9 +376,10 @@ class SubmitScan:
             for job in dic_all_jobs:
                 # Get all failed dependencies across the tree
                 l_dep_failed = dependency_graph.get_failed_dependency(job)
+                dic_job = nested_get(dic_tree, dic_all_jobs[job]["l_keys"])
                 if len(l_dep_failed) > 0:
-                    nested_set(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"], "unsubmittable")
-                elif nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"]) == "to_submit":
+                    dic_job["status"] = "unsubmittable"
+                elif dic_job["status"] == "to_submit":
                     at_least_one_job_to_finish = True
 
             if not at_least_one_job_to_finish:
@@ -349,7 +387,7 @@ class SubmitScan:
                 dic_tree["status"] = final_status = "finished"
                 # Last pass to check if all jobs are properly finished
                 for job in dic_all_jobs:
-                    if nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"]) != "finished":
+                    if nested_get(dic_tree, dic_all_jobs[job]["l_keys"])["status"] != "finished":
                         dic_tree["status"] = final_status = "finished with issues"
                         break
 
@@ -373,7 +411,8 @@ class SubmitScan:
         # First pass to update the state of the tree
         for job in dic_all_jobs:
             # Skip jobs that are not failed
-            if nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"]) != "failed":
+            dic_job = nested_get(dic_tree, dic_all_jobs[job]["l_keys"])
+            if dic_job["status"] != "failed":
                 continue
 
             # Reset the state of the others
@@ -387,15 +426,15 @@ class SubmitScan:
                 logging.warning(f"Failed file not found for job {job}.")
 
             # Remove run file
-            if "path_run" in nested_get(dic_tree, dic_all_jobs[job]["l_keys"]):
-                path_run_curr = nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["path_run"])
+            if "path_run" in dic_job:
+                path_run_curr = dic_job["path_run"]
                 if path_run_curr is not None and os.path.exists(path_run_curr):
                     os.remove(path_run_curr)
                 else:
                     logging.warning(f"Run file not found for job {job}.")
 
             # Reset the status of the job
-            nested_set(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"], "to_submit")
+            dic_job["status"] = "to_submit"
 
         return dic_tree
 
@@ -664,11 +703,12 @@ class SubmitScan:
         # Job dependencies are ok
         elif len(l_dep) == 0:
             # But job has failed already
-            if nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"]) == "failed":
+            status = nested_get(dic_tree, dic_all_jobs[job]["l_keys"])["status"]
+            if status == "failed":
                 dic_summary_by_gen[gen]["failed"] += 1
 
             # Or job has finished already
-            elif nested_get(dic_tree, dic_all_jobs[job]["l_keys"] + ["status"]) == "finished":
+            elif status == "finished":
                 dic_summary_by_gen[gen]["finished"] += 1
 
             # Else everything is ok, added to the submit dict
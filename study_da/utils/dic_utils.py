@@ -2,8 +2,8 @@
 This module provides utility functions for handling nested dictionaries and YAML files.
 
 Functions:
-    load_dic_from_path(path: str, ryaml: ruamel.yaml.YAML | None = None)
-        -> tuple[dict, ruamel.yaml.YAML]:
+    load_dic_from_path(path: str, ryaml: ruamel.yaml.YAML | None = None, use_cache: bool = False,
+        typ: str = "rt") -> tuple[dict, ruamel.yaml.YAML]:
         Load a dictionary from a YAML file.
 
     write_dic_to_path(dic: dict, path: str, ryaml: ruamel.yaml.YAML | None = None) -> None:
@@ -30,6 +30,9 @@ Functions:
 # ==================================================================================================
 
 # Import standard library modules
+import copy
+import functools
+import io
 import os
 from typing import Any
 
@@ -45,23 +48,60 @@ import ruamel.yaml
 # ==================================================================================================
 
 
+@functools.lru_cache(maxsize=100)
+def _load_dic_from_path_cached(
+    abs_path: str, mtime_ns: int, size: int, typ: str = "rt"
+) -> tuple[dict, ruamel.yaml.YAML]:
+    """Load a dictionary from a yaml file, caching the result. The modification time and the size
+    of the file are part of the cache key, such that a modified file is always reloaded.
+
+    Args:
+        abs_path (str): The absolute path to the yaml file.
+        mtime_ns (int): The modification time of the file, in nanoseconds.
+        size (int): The size of the file, in bytes.
+        typ (str): The type of yaml reader. Defaults to "rt".
+
+    Returns:
+        tuple[dict, ruamel.yaml.YAML]: The dictionary and the yaml reader.
+    """
+    ryaml = ruamel.yaml.YAML(typ=typ)
+    with open(abs_path, "r") as fid:
+        dic = ryaml.load(fid)
+
+    return dic, ryaml
+
+
 def load_dic_from_path(
-    path: str, ryaml: ruamel.yaml.YAML | None = None
+    path: str, ryaml: ruamel.yaml.YAML | None = None, use_cache: bool = False, typ: str = "rt"
 ) -> tuple[dict, ruamel.yaml.YAML]:
     """Load a dictionary from a yaml file.
 
     Args:
         path (str): The path to the yaml file.
         ryaml (ruamel.yaml.YAML): The yaml reader.
+        use_cache (bool): Whether to reuse the result of a previous load of the same (unmodified)
+            file. Only used if no yaml reader is provided. A copy of the cached dictionary is
+            returned, so that it can safely be mutated. Defaults to False.
+        typ (str): The type of yaml reader, if none is provided. The default round-trip reader
+            ("rt") preserves comments and formatting, while the "safe" reader returns plain Python
+            objects and relies on the C parser (ruamel.yaml.clib) when it is installed, which is
+            much faster. Defaults to "rt".
 
     Returns:
         tuple[dict, ruamel.yaml.YAML]: The dictionary and the yaml reader.
 
     """
 
+    if use_cache and ryaml is None:
+        stat = os.stat(path)
+        dic, ryaml = _load_dic_from_path_cached(
+            os.path.abspath(path), stat.st_mtime_ns, stat.st_size, typ
+        )
+        return copy.deepcopy(dic), ryaml
+
     if ryaml is None:
         # Initialize yaml reader
-        ryaml = ruamel.yaml.YAML()
+        ryaml = ruamel.yaml.YAML(typ=typ)
 
     # Load dic
     with open(path, "r") as fid:
@@ -87,9 +127,14 @@ def write_dic_to_path(dic: dict, path: str, ryaml: ruamel.yaml.YAML | None = Non
         # Initialize yaml reader
         ryaml = ruamel.yaml.YAML()
 
+    # Dump in memory first, such that the file is written at once rather than in many small chunks
+    # (which is slow on network filesystems)
+    stream = io.StringIO()
+    ryaml.dump(dic, stream)
+
     # Write dic
     with open(path, "w") as fid:
-        ryaml.dump(dic, fid)
+        fid.write(stream.getvalue())
         # Force os to write to disk now, to avoid race conditions
         fid.flush()
         os.fsync(fid.fileno())
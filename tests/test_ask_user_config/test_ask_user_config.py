@@ -0,0 +1,128 @@
+# ==================================================================================================
+# --- Imports
+# ==================================================================================================
+
+# Import standard library modules
+import logging
+
+# Import third-party modules
+import pytest
+
+# Import user-defined modules
+from study_da.submit import ask_user_config
+
+# ==================================================================================================
+# --- Cases
+# ==================================================================================================
+
+# Each case contains a function asking the question and returning the answer, the environment
+# variable, a valid value for it and the corresponding answer, and an input to the prompt and the
+# corresponding answer
+L_CASES = [
+    (
+        lambda: _set_in_dic(ask_user_config.ask_and_set_gpu, "request_gpu"),
+        "STUDY_DA_REQUEST_GPU",
+        "y",
+        True,
+        "n",
+        False,
+    ),
+    (
+        lambda: _set_in_dic(ask_user_config.ask_and_set_run_on, "submission_type"),
+        "STUDY_DA_SUBMISSION_TYPE",
+        "slurm",
+        "slurm",
+        "2",
+        "htc",
+    ),
+    (
+        lambda: _set_in_dic(ask_user_config.ask_and_set_htc_flavour, "htc_flavor"),
+        "STUDY_DA_HTC_FLAVOR",
+        "workday",
+        "workday",
+        "3",
+        "longlunch",
+    ),
+    (
+        lambda: ask_user_config.ask_keep_setting("generation_1"),
+        "STUDY_DA_KEEP_SETTING",
+        "n",
+        False,
+        "y",
+        True,
+    ),
+    (
+        ask_user_config.ask_skip_configured_jobs,
+        "STUDY_DA_SKIP_CONFIGURED_JOBS",
+        "n",
+        False,
+        "y",
+        True,
+    ),
+]
+L_IDS = ["gpu", "run_on", "htc_flavour", "keep_setting", "skip_configured_jobs"]
+
+
+def _set_in_dic(ask_and_set, key: str):
+    dic_gen = {"file": "generation_1.py"}
+    ask_and_set(dic_gen)
+    return dic_gen[key]
+
+
+def _no_input(prompt=""):
+    raise AssertionError("The question should not have been asked")
+
+
+# ==================================================================================================
+# --- Tests
+# ==================================================================================================
+
+
+@pytest.mark.parametrize(
+    "ask, name_env, value_env, answer_env, value_prompt, answer_prompt", L_CASES, ids=L_IDS
+)
+def test_valid_env_skips_prompt(
+    ask, name_env, value_env, answer_env, value_prompt, answer_prompt, monkeypatch
+) -> None:
+    monkeypatch.setenv(name_env, value_env)
+    monkeypatch.setattr("builtins.input", _no_input)
+
+    assert ask() == answer_env
+
+
+@pytest.mark.parametrize(
+    "ask, name_env, value_env, answer_env, value_prompt, answer_prompt", L_CASES, ids=L_IDS
+)
+def test_invalid_env_falls_back_to_prompt(
+    ask, name_env, value_env, answer_env, value_prompt, answer_prompt, monkeypatch, caplog
+) -> None:
+    monkeypatch.setenv(name_env, "invalid")
+    l_prompts = []
+    monkeypatch.setattr(
+        "builtins.input", lambda prompt="": l_prompts.append(prompt) or value_prompt
+    )
+
+    with caplog.at_level(logging.WARNING):
+        assert ask() == answer_prompt
+
+    assert len(l_prompts) == 1
+    assert any(
+        record.levelno == logging.WARNING and name_env in record.getMessage()
+        for record in caplog.records
+    )
+
+
+@pytest.mark.parametrize(
+    "ask, name_env, value_env, answer_env, value_prompt, answer_prompt", L_CASES, ids=L_IDS
+)
+def test_unset_env_keeps_prompt(
+    ask, name_env, value_env, answer_env, value_prompt, answer_prompt, monkeypatch
+) -> None:
+    monkeypatch.delenv(name_env, raising=False)
+    l_prompts = []
+    monkeypatch.setattr(
+        "builtins.input", lambda prompt="": l_prompts.append(prompt) or value_prompt
+    )
+
+    assert ask() == answer_prompt
+    assert len(l_prompts) == 1
@@ -0,0 +1,254 @@
+# ==================================================================================================
+# --- Imports
+# ==================================================================================================
+
+# Import standard library modules
+import getpass
+import logging
+import subprocess
+import sys
+from typing import Optional
+
+# Import third-party modules
+import pytest
+
+# Import user-defined modules
+from study_da.submit.cluster_submission import ClusterSubmission
+
+# ==================================================================================================
+# --- Helpers
+# ==================================================================================================
+
+STUDY_NAME = "study_test"
+L_JOBS = [f"{STUDY_NAME}/job_{idx}/generation_1.py" for idx in range(3)]
+CONDOR_STATUS = ("condor_q", "-af", "ClusterId", "JobStatus")
+CONDOR_CMD = ("condor_q", "-af", "ClusterId", "Cmd")
+SQUEUE_STATUS = ("squeue", "-u", "user", "-t", "RUNNING,PENDING", "-h", "-o", "%i %t")
+SQUEUE_CMD = ("squeue", "-u", "user", "-t", "RUNNING,PENDING", "-h", "-o", "%i|%o")
+
+
+def get_cluster_submission(
+    submission_type: str, l_ids: tuple[Optional[int], ...] = (None, None, None)
+) -> ClusterSubmission:
+    """Builds a ClusterSubmission for three jobs, with the given submission ids (if any)."""
+    dic_tree = {}
+    dic_all_jobs = {}
+    for idx, (job, jobid) in enumerate(zip(L_JOBS, l_ids)):
+        dic_job = {"file": job, "submission_type": submission_type, "status": "to_submit"}
+        if jobid is not None:
+            dic_job["id_sub"] = jobid
+        dic_tree[f"job_{idx}"] = {"generation_1": dic_job}
+        dic_all_jobs[job] = {"l_keys": [f"job_{idx}", "generation_1"], "gen": 1}
+
+    return ClusterSubmission(
+        STUDY_NAME,
+        L_JOBS,
+        dic_all_jobs,
+        dic_tree,
+        f"{STUDY_NAME}/submission/submission_file.sub",
+        "/abs/path",
+    )
+
+
+def patch_queries(monkeypatch, dic_outputs: dict[tuple[str, ...], str]) -> list[tuple[str, ...]]:
+    """Replaces the scheduler queries by canned outputs, and returns the list of run commands."""
+    l_commands = []
+
+    def run(l_command, **kwargs):
+        l_commands.append(tuple(l_command))
+        stdout = dic_outputs.get(tuple(l_command), "")
+        stderr = ""
+
+        # Raw outputs, unless text mode is requested
+        if not kwargs.get("encoding"):
+            stdout, stderr = stdout.encode(), stderr.encode()
+        return subprocess.CompletedProcess(l_command, 0, stdout=stdout, stderr=stderr)
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(getpass, "getuser", lambda: "user")
+
+    # Use condor_q rather than the HTCondor Python bindings
+    monkeypatch.setitem(sys.modules, "htcondor", None)
+
+    return l_commands
+
+
+# ==================================================================================================
+# --- Tests HTCondor
+# ==================================================================================================
+
+
+def test_condor_jobs_status(monkeypatch) -> None:
+    # Running, idle and held jobs of the study, and a job of another study
+    patch_queries(
+        monkeypatch,
+        {CONDOR_STATUS: "1234567 2\n1234567 2\n1234568 1\n1234569 5\n999 2\n"},
+    )
+    cluster_submission = get_cluster_submission("htc", (1234567, 1234568, 1234569))
+
+    assert cluster_submission._get_condor_jobs() == (
+        [f"{STUDY_NAME}/job_0/"],
+        [f"{STUDY_NAME}/job_1/"],
+    )
+
+
+def test_condor_jobs_status_mixed_cluster(monkeypatch, caplog) -> None:
+    # The only job of the study is a cluster with both running and idle jobs, listed before the
+    # jobs of another study
+    patch_queries(monkeypatch, {CONDOR_STATUS: "1234567 1\n1234567 2\n1234567 1\n999 2\n"})
+    cluster_submission = get_cluster_submission("htc", (1234567, None, None))
+
+    with caplog.at_level(logging.WARNING):
+        running_jobs, queuing_jobs = cluster_submission._get_condor_jobs()
+
+    # Both statuses are kept, and the queue is not parsed further once the study jobs are found
+    assert running_jobs == [f"{STUDY_NAME}/job_0/"]
+    assert queuing_jobs == [f"{STUDY_NAME}/job_0/"]
+    assert not caplog.records
+
+
+def test_condor_jobs_path(monkeypatch) -> None:
+    # No id-job mapping, the path of the jobs is retrieved from their command
+    patch_queries(
+        monkeypatch,
+        {
+            CONDOR_STATUS: "1234567 2\n1234568 1\n999 2\n",
+            CONDOR_CMD: (
+                f"1234567 /abs/path/{STUDY_NAME}/job_0/run.sh\n"
+                f"1234568 /abs/path/{STUDY_NAME}/job_1/run.sh\n"
+                "999 /abs/path/other_study/job_0/run.sh\n"
+            ),
+        },
+    )
+    cluster_submission = get_cluster_submission("htc")
+
+    assert cluster_submission._get_condor_jobs(force_query_individually=True) == (
+        [f"{STUDY_NAME}/job_0/"],
+        [f"{STUDY_NAME}/job_1/"],
+    )
+
+
+# ==================================================================================================
+# --- Tests Slurm
+# ==================================================================================================
+
+
+def test_slurm_jobs_status(monkeypatch) -> None:
+    # Running, pending and completing jobs of the study, and a job of another study
+    patch_queries(monkeypatch, {SQUEUE_STATUS: "1001 R\n1002 PD\n1003 CG\n77 R\n"})
+    cluster_submission = get_cluster_submission("slurm", (1001, 1002, 1003))
+
+    assert cluster_submission._get_slurm_jobs() == (
+        [f"{STUDY_NAME}/job_0/"],
+        [f"{STUDY_NAME}/job_1/"],
+    )
+
+
+def test_slurm_jobs_path(monkeypatch) -> None:
+    # No id-job mapping: the path of the jobs run from a run.sh script is retrieved from their
+    # command, and the other jobs (e.g. Slurm Docker ones) are queried individually
+    l_commands = patch_queries(
+        monkeypatch,
+        {
+            SQUEUE_STATUS: "1001 R\n1002 PD\n77 R\n78 PD\n",
+            SQUEUE_CMD: (
+                f"1001|/abs/path/{STUDY_NAME}/job_0/run.sh\n"
+                f"1002|/abs/path/{STUDY_NAME}/submission/submission_file_1.sub\n"
+                "77|/abs/path/other_study/job_0/run.sh\n"
+                "78|/abs/path/other_study/submission/submission_file_0.sub\n"
+            ),
+            ("scontrol", "show", "jobid", "-dd", "1002"): (
+                "JobId=1002 JobName=submission_file_1.sub\n"
+                f"   Command=/abs/path/{STUDY_NAME}/submission/submission_file_1.sub\n"
+                f"   StdOut=/abs/path/{STUDY_NAME}/job_1/output.txt\n"
+            ),
+            ("scontrol", "show", "jobid", "-dd", "78"): (
+                "JobId=78 JobName=submission_file_0.sub\n"
+                "   Command=/abs/path/other_study/submission/submission_file_0.sub\n"
+                "   StdOut=/abs/path/other_study/job_0/output.txt\n"
+            ),
+        },
+    )
+    cluster_submission = get_cluster_submission("slurm_docker")
+
+    assert cluster_submission._get_slurm_jobs(force_query_individually=True) == (
+        [f"{STUDY_NAME}/job_0/"],
+        [f"{STUDY_NAME}/job_1/"],
+    )
+
+    # Only the jobs not run from a run.sh script are queried individually
+    assert sorted(command[-1] for command in l_commands if command[0] == "scontrol") == [
+        "1002",
+        "78",
+    ]
+
+
+@pytest.mark.parametrize(
+    "job_details, path_job",
+    [
+        (
+            f"   Command=/abs/path/{STUDY_NAME}/job_0/run.sh\n"
+            f"   StdOut=/abs/path/{STUDY_NAME}/job_0/output.txt\n",
+            f"{STUDY_NAME}/job_0/",
+        ),
+        (
+            f"   Command=/abs/path/{STUDY_NAME}/submission/submission_file_1.sub\n"
+            f"   StdOut=/abs/path/{STUDY_NAME}/job_1/output.txt\n",
+            f"{STUDY_NAME}/job_1/",
+        ),
+        (
+            "   Command=/abs/path/other_study/submission/submission_file_0.sub\n"
+            "   StdOut=/abs/path/other_study/job_0/output.txt\n",
+            None,
+        ),
+        ("", None),
+    ],
+    ids=["command", "stdout", "other_study", "missing"],
+)
+def test_slurm_job_path(job_details: str, path_job: Optional[str], monkeypatch) -> None:
+    patch_queries(monkeypatch, {("scontrol", "show", "jobid", "-dd", "1001"): job_details})
+    cluster_submission = get_cluster_submission("slurm")
+
+    assert cluster_submission._get_slurm_job_path(1001) == path_job
+
+
+# ==================================================================================================
+# --- Tests Slurm Docker submission
+# ==================================================================================================
+
+
+@pytest.mark.parametrize("n_ids", [3, 2], ids=["all_submitted", "one_failed"])
+def test_slurm_docker_submission_ids(n_ids: int, tmp_path, monkeypatch) -> None:
+    # All the submission files are submitted through a single launcher script, and the submitted
+    # jobs are then pending
+    monkeypatch.chdir(tmp_path)
+    path_launcher = f"{STUDY_NAME}/submission/submission_file_slurm_docker.sh"
+    patch_queries(
+        monkeypatch,
+        {
+            ("bash", path_launcher): "".join(
+                f"Submitted batch job {1001 + idx}\n" for idx in range(n_ids)
+            ),
+            SQUEUE_STATUS: "".join(f"{1001 + idx} PD\n" for idx in range(n_ids)),
+        },
+    )
+    cluster_submission = get_cluster_submission("slurm_docker")
+    l_submission_filenames = [f"submission_file_{idx}.sub" for idx in range(3)]
+
+    if n_ids == len(L_JOBS):
+        cluster_submission.submit(L_JOBS, l_submission_filenames, "slurm_docker")
+        assert cluster_submission.dic_id_to_path_job == {
+            1001 + idx: f"{STUDY_NAME}/job_{idx}/" for idx in range(3)
+        }
+    else:
+        # The ids can't be matched to the jobs anymore
+        with pytest.raises(RuntimeError):
+            cluster_submission.submit(L_JOBS, l_submission_filenames, "slurm_docker")
+
+    # The launcher stops at the first failed submission
+    with open(path_launcher) as fid:
+        assert fid.read().splitlines()[:3] == [
+            "# Running on SLURM Docker",
+            "set -e",
+            "sbatch submission_file_0.sub",
+        ]
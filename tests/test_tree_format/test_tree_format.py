@@ -0,0 +1,70 @@
+# ==================================================================================================
+# --- Imports
+# ==================================================================================================
+
+# Import standard library modules
+import os
+import shutil
+
+# Import third-party modules
+import pytest
+
+# Import user-defined modules
+from study_da import create, submit
+from study_da.utils import load_dic_from_path, write_dic_to_path
+
+# Path to the dummy study used for the test
+PATH_EXAMPLE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "../../examples/in_docs_tutorials/concepts_generation_submission",
+)
+
+# ==================================================================================================
+# --- Test the format of the tree file
+# ==================================================================================================
+
+
+@pytest.mark.parametrize("emit_yaml_tree", [True, False])
+def test_tree_format(emit_yaml_tree: bool, tmp_path, monkeypatch) -> None:
+    # Work on a copy of the dummy study, with the requested tree format
+    shutil.copytree(PATH_EXAMPLE, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    config, ryaml = load_dic_from_path("config_scan.yaml")
+    config["emit_yaml_tree"] = emit_yaml_tree
+    write_dic_to_path(config, "config_scan.yaml", ryaml)
+
+    # Generate the study
+    path_tree, name_main_configuration = create(
+        path_config_scan="config_scan.yaml", force_overwrite=True
+    )
+
+    # Only the tree of the requested format is written, and its path is returned
+    name_tree, name_other_tree = (
+        ("tree.yaml", "tree.json") if emit_yaml_tree else ("tree.json", "tree.yaml")
+    )
+    assert path_tree == f"{config['name']}/{name_tree}"
+    assert os.path.exists(path_tree)
+    assert not os.path.exists(f"{config['name']}/{name_other_tree}")
+
+    # Empty environment, such that the jobs run with the current python interpreter
+    os.makedirs("venv/bin")
+    open("venv/bin/activate", "w").close()
+
+    # Submit the study locally from the returned tree
+    dic_config_jobs = {
+        "generation_1.py": {"request_gpu": False, "submission_type": "local"},
+        "generation_2.py": {"request_gpu": False, "submission_type": "local"},
+    }
+    submit(
+        path_tree=path_tree,
+        name_config=name_main_configuration,
+        path_python_environment="venv",
+        dic_config_jobs=dic_config_jobs,
+        keep_submit_until_done=True,
+        wait_time=0.1,
+    )
+
+    # The tree has been updated in place (a JSON file is also valid YAML)
+    dic_tree = load_dic_from_path(path_tree, typ="safe")[0]
+    assert dic_tree["status"] == "finished"
+    assert not os.path.exists(f"{config['name']}/{name_other_tree}")